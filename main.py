@@ -7,10 +7,6 @@ For the new CLI interface, use: python -m src.presentation.cli.main
 """
 
 import sys
-from pathlib import Path
-
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from src.application.use_cases.generate_reports import GenerateReportsUseCase
 from src.infrastructure.config.settings import configure_app
@@ -1,12 +1,15 @@
 """Use case for generating BNI analysis reports."""
 
 import time
+from dataclasses import replace
 from pathlib import Path
-from typing import List
+from typing import List, Optional, Tuple
 
-from src.application.dto.report_request import ReportGenerationRequest
-from src.application.dto.analysis_response import ReportGenerationResponse
+from src.application.dto.report_request import ReportGenerationRequest, ProcessPalmsDataRequest
+from src.application.dto.analysis_response import ReportGenerationResponse, ProcessPalmsDataResponse
+from src.application.use_cases.process_palms_data import LoadedPalmsData, ProcessPalmsDataUseCase
 from src.domain.services.analysis_service import AnalysisService
+from src.domain.services.tyfcb_service import TYFCBService, TYFCBSummary
 from src.domain.exceptions.domain_exceptions import DataProcessingError, ExportError
 from src.infrastructure.config.paths import get_path_manager
 from src.shared.constants.app_constants import FileNames
@@ -19,14 +22,18 @@ class GenerateReportsUseCase:
     def __init__(self):
         self.analysis_service = AnalysisService()
         self.export_service = ExportService()
+        self.tyfcb_service = TYFCBService()
         self.path_manager = get_path_manager()
     
-    def execute(self, request: ReportGenerationRequest) -> ReportGenerationResponse:
+    def execute(self, request: ReportGenerationRequest,
+                loaded_data: Optional[LoadedPalmsData] = None) -> ReportGenerationResponse:
         """
         Execute the report generation use case.
         
         Args:
             request: Report generation request
+            loaded_data: Optional already-loaded (members, referrals, one_to_ones, tyfcbs);
+                the data files are read from disk when omitted
             
         Returns:
             Report generation response
@@ -39,45 +46,44 @@ class GenerateReportsUseCase:
             request.validate()
             
             # Generate complete analysis
-            report = self.analysis_service.generate_complete_analysis()
+            if loaded_data is not None:
+                report = self.analysis_service.generate_complete_analysis(*loaded_data)
+            else:
+                report = self.analysis_service.generate_complete_analysis()
             response.report = report
             
             # Set output directory
             output_dir = request.output_directory or self.path_manager.reports_dir
             
-            # Generate requested reports
-            if request.include_referral_matrix:
-                try:
-                    file_path = self._export_referral_matrix(report, output_dir)
-                    response.add_generated_file(file_path)
-                except Exception as e:
-                    response.add_error(f"Failed to generate referral matrix: {str(e)}")
+            # TYFCB statistics are shared by the TYFCB and comprehensive reports
+            tyfcb_summary = self.tyfcb_service.generate_tyfcb_summary(report.all_members, report.tyfcbs)
             
-            if request.include_oto_matrix:
-                try:
-                    file_path = self._export_oto_matrix(report, output_dir)
-                    response.add_generated_file(file_path)
-                except Exception as e:
-                    response.add_error(f"Failed to generate OTO matrix: {str(e)}")
+            # Generate requested matrices in request order
+            matrix_exports = (
+                (request.include_referral_matrix, self._export_referral_matrix, "referral matrix"),
+                (request.include_oto_matrix, self._export_oto_matrix, "OTO matrix"),
+                (request.include_combination_matrix, self._export_combination_matrix, "combination matrix"),
+            )
             
-            if request.include_combination_matrix:
+            for include, export, label in matrix_exports:
+                if not include:
+                    continue
                 try:
-                    file_path = self._export_combination_matrix(report, output_dir)
-                    response.add_generated_file(file_path)
+                    response.add_generated_file(export(report, output_dir))
                 except Exception as e:
-                    response.add_error(f"Failed to generate combination matrix: {str(e)}")
+                    response.add_error(f"Failed to generate {label}: {str(e)}")
             
             # Always generate TYFCB data if TYFCB entries exist
             if report.tyfcbs:
                 try:
-                    file_path = self._export_tyfcb_data(report, output_dir)
+                    file_path = self._export_tyfcb_data(report, output_dir, tyfcb_summary)
                     response.add_generated_file(file_path)
                 except Exception as e:
                     response.add_error(f"Failed to generate TYFCB data: {str(e)}")
             
             if request.include_comprehensive_member_report:
                 try:
-                    file_path = self._export_comprehensive_member_report(report, output_dir)
+                    file_path = self._export_comprehensive_member_report(report, output_dir, tyfcb_summary)
                     response.add_generated_file(file_path)
                 except Exception as e:
                     response.add_error(f"Failed to generate comprehensive member report: {str(e)}")
@@ -101,6 +107,46 @@ class GenerateReportsUseCase:
         
         return response
     
+    def execute_with_validation(self, request: ReportGenerationRequest,
+                                process_request: ProcessPalmsDataRequest,
+                                process_use_case: Optional[ProcessPalmsDataUseCase] = None
+                                ) -> Tuple[ProcessPalmsDataResponse, ReportGenerationResponse]:
+        """
+        Process and validate the data, then generate reports from the same load.
+        
+        The PALMS and member files are parsed once and the loaded data is handed
+        straight to report generation instead of being read again.
+        
+        Args:
+            request: Report generation request
+            process_request: PALMS data processing request
+            process_use_case: Optional processing use case to reuse
+            
+        Returns:
+            Tuple of (processing response, report generation response)
+        """
+        process_use_case = process_use_case or ProcessPalmsDataUseCase()
+        process_response, loaded_data = process_use_case.execute_and_load(process_request)
+        
+        if not process_response.success or loaded_data is None:
+            response = ReportGenerationResponse(success=False)
+            for error in process_response.errors:
+                response.add_error(error)
+            if not response.errors:
+                response.add_error("Data processing failed")
+            return process_response, response
+        
+        # XLS conversion may have replaced the requested files, so point the
+        # request at the files that were actually processed
+        processed_files = process_response.processed_files
+        request = replace(
+            request,
+            excel_files=[f for f in processed_files if f.parent == process_request.data_directory],
+            member_files=[f for f in processed_files if f.parent == process_request.member_directory]
+        )
+        
+        return process_response, self.execute(request, loaded_data)
+    
     def _export_referral_matrix(self, report, output_dir: Path) -> Path:
         """Export the referral matrix to Excel."""
         try:
@@ -140,27 +186,31 @@ class GenerateReportsUseCase:
         except Exception as e:
             raise ExportError(f"Failed to export combination matrix: {str(e)}")
     
-    def _export_tyfcb_data(self, report, output_dir: Path) -> Path:
+    def _export_tyfcb_data(self, report, output_dir: Path,
+                           tyfcb_summary: Optional[TYFCBSummary] = None) -> Path:
         """Export the TYFCB data to Excel."""
         try:
             file_path = output_dir / FileNames.TYFCB_DATA
             self.export_service.export_tyfcb_data(
                 report.all_members,
                 report.tyfcbs,
-                file_path
+                file_path,
+                tyfcb_summary
             )
             return file_path
             
         except Exception as e:
             raise ExportError(f"Failed to export TYFCB data: {str(e)}")
     
-    def _export_comprehensive_member_report(self, report, output_dir: Path) -> Path:
+    def _export_comprehensive_member_report(self, report, output_dir: Path,
+                                            tyfcb_summary: Optional[TYFCBSummary] = None) -> Path:
         """Export the comprehensive member report to Excel."""
         try:
             file_path = output_dir / FileNames.COMPREHENSIVE_MEMBER_REPORT
             self.export_service.export_comprehensive_member_report(
                 report,
-                file_path
+                file_path,
+                tyfcb_summary
             )
             return file_path
             
@@ -220,13 +270,16 @@ class GenerateReportsUseCase:
         errors = []
         
         try:
-            # Check if files exist and are readable
-            for file_path in excel_files + member_files:
+            # Check if files exist and are readable (PALMS data may also be CSV)
+            files_to_check = [(file_path, ('.xls', '.xlsx', '.csv')) for file_path in excel_files]
+            files_to_check.extend((file_path, ('.xls', '.xlsx')) for file_path in member_files)
+            
+            for file_path, allowed_extensions in files_to_check:
                 if not file_path.exists():
                     errors.append(f"File not found: {file_path}")
                 elif not file_path.is_file():
                     errors.append(f"Path is not a file: {file_path}")
-                elif file_path.suffix.lower() not in ['.xls', '.xlsx']:
+                elif file_path.suffix.lower() not in allowed_extensions:
                     errors.append(f"Unsupported file format: {file_path}")
             
             # Validate PALMS files format
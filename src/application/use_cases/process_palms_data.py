@@ -2,7 +2,7 @@
 
 import time
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from src.application.dto.report_request import ProcessPalmsDataRequest
 from src.application.dto.analysis_response import ProcessPalmsDataResponse
@@ -15,6 +15,9 @@ from src.domain.exceptions.domain_exceptions import DataProcessingError
 from src.infrastructure.data.file_handlers.file_converter import FileConverter
 from src.infrastructure.config.paths import get_path_manager
 
+# Members, referrals, one-to-ones and TYFCBs loaded during processing
+LoadedPalmsData = Tuple[List[Member], List[Referral], List[OneToOne], List[TYFCB]]
+
 
 class ProcessPalmsDataUseCase:
     """Use case for processing PALMS data files and preparing them for analysis."""
@@ -34,7 +37,24 @@ class ProcessPalmsDataUseCase:
         Returns:
             Processing response with results and statistics
         """
+        response, _ = self.execute_and_load(request)
+        return response
+    
+    def execute_and_load(self, request: ProcessPalmsDataRequest) -> Tuple[ProcessPalmsDataResponse, Optional[LoadedPalmsData]]:
+        """
+        Execute the PALMS data processing use case and keep the loaded data.
+        
+        Lets callers reuse the parsed members and PALMS records instead of
+        reading the files a second time.
+        
+        Args:
+            request: PALMS data processing request
+            
+        Returns:
+            Tuple of (processing response, loaded data or None if loading failed)
+        """
         start_time = time.time()
+        loaded_data = None
         response = ProcessPalmsDataResponse(success=True)
         
         try:
@@ -56,7 +76,7 @@ class ProcessPalmsDataUseCase:
             
             if not members:
                 response.add_error("No valid members found")
-                return response
+                return response, loaded_data
             
             # Load PALMS data
             referrals, one_to_ones, tyfcbs = self._load_palms_data(
@@ -65,6 +85,7 @@ class ProcessPalmsDataUseCase:
             response.referrals_count = len(referrals)
             response.one_to_ones_count = len(one_to_ones)
             response.tyfcbs_count = len(tyfcbs)
+            loaded_data = (members, referrals, one_to_ones, tyfcbs)
             
             # Validate data quality if requested
             if request.validate_data:
@@ -101,7 +122,7 @@ class ProcessPalmsDataUseCase:
         finally:
             response.execution_time_seconds = time.time() - start_time
         
-        return response
+        return response, loaded_data
     
     def _convert_xls_files(self, directory: Path) -> List[Path]:
         """Convert all XLS files in a directory to XLSX format."""
@@ -164,9 +185,9 @@ class ProcessPalmsDataUseCase:
         try:
             processed_files = []
             
-            # Get Excel files
+            # Get Excel and CSV PALMS files
             if data_directory.exists():
-                for ext in ['.xlsx', '.xls']:
+                for ext in ['.xlsx', '.xls', '.csv']:
                     processed_files.extend(data_directory.glob(f"*{ext}"))
             
             # Get member files
@@ -1,10 +1,14 @@
 from dataclasses import dataclass, field
-from typing import Dict, List, Any, Optional
+from types import MappingProxyType
+from typing import Dict, List, Any, Optional, Mapping
 from enum import Enum
 
 from .member import Member
 from .tyfcb import TYFCB
 
+# Shared read-only row returned for members with no matrix data
+_EMPTY_ROW: Mapping[Member, int] = MappingProxyType({})
+
 
 class MatrixType(Enum):
     """Types of matrices that can be generated."""
@@ -59,9 +63,13 @@ class AnalysisMatrix:
     member_statistics: Dict[Member, MemberStatistics] = field(default_factory=dict)
     total_members: int = 0
     
+    def get_row(self, row_member: Member) -> Mapping[Member, int]:
+        """Get a member's row of values, or an empty read-only row if it has none."""
+        return self.data.get(row_member, _EMPTY_ROW)
+    
     def get_cell_value(self, row_member: Member, column_member: Member) -> int:
         """Get the value at a specific matrix position."""
-        return self.data.get(row_member, {}).get(column_member, 0)
+        return self.data.get(row_member, _EMPTY_ROW).get(column_member, 0)
     
     def set_cell_value(self, row_member: Member, column_member: Member, value: int) -> None:
         """Set the value at a specific matrix position."""
@@ -69,6 +77,19 @@ class AnalysisMatrix:
             self.data[row_member] = {}
         self.data[row_member][column_member] = value
     
+    def to_rows(self, members: List[Member]) -> List[List[int]]:
+        """
+        Get the matrix values as one list per row member, in the given member order.
+        
+        Each row's data is looked up once, so callers reading the whole matrix
+        avoid a get_cell_value call per cell.
+        """
+        rows = []
+        for row_member in members:
+            row_data = self.data.get(row_member, _EMPTY_ROW)
+            rows.append([row_data.get(column_member, 0) for column_member in members])
+        return rows
+    
     def get_all_members(self) -> List[Member]:
         """Get all members involved in this matrix."""
         members = set()
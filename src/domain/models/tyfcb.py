@@ -5,9 +5,14 @@ from typing import Optional
 from .member import Member
 
 
-@dataclass
+@dataclass(slots=True)
 class TYFCB:
-    """Domain model representing a TYFCB (Thank You For Closed Business) received by a BNI member."""
+    """
+    Domain model representing a TYFCB (Thank You For Closed Business) received by a BNI member.
+    
+    Slotted, since a chapter's PALMS history holds many entries and exports read
+    their fields in tight loops.
+    """
     
     receiver: Member  # The member who received the business
     amount: float
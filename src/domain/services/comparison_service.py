@@ -1,14 +1,19 @@
 """Service for handling matrix comparisons and trend analysis."""
 
 from typing import List, Dict, Any, Optional, Tuple
+import numpy as np
 import pandas as pd
 from pathlib import Path
+from openpyxl.cell import WriteOnlyCell
 
 from src.domain.models.member import Member
 from src.domain.models.analysis_result import AnalysisMatrix, MatrixType, ComparisonResult
 from src.domain.exceptions.domain_exceptions import DataProcessingError
-from src.infrastructure.data.file_handlers.excel_handler import ExcelHandler
-from src.shared.constants.app_constants import MatrixHeaders
+from src.infrastructure.data.file_handlers.excel_handler import (
+    ExcelHandler, ColumnWidthTracker,
+    MATRIX_HEADER_STYLE, MATRIX_LABEL_STYLE, MATRIX_VALUE_STYLE, MATRIX_ZERO_STYLE
+)
+from src.shared.constants.app_constants import MatrixHeaders, COMBINATION_SUMMARY_HEADERS
 
 
 class ComparisonService:
@@ -55,21 +60,15 @@ class ComparisonService:
             Dictionary mapping header names to (row, col) positions
         """
         try:
-            required_headers = [
-                MatrixHeaders.NEITHER,
-                MatrixHeaders.OTO_ONLY,
-                MatrixHeaders.REFERRAL_ONLY,
-                MatrixHeaders.OTO_AND_REFERRAL
-            ]
+            required_headers = COMBINATION_SUMMARY_HEADERS
             
             header_locations = {}
             
-            # Search through the dataframe for each header
-            for row_idx in range(len(df)):
-                for col_idx in range(len(df.columns)):
-                    cell_value = df.iloc[row_idx, col_idx]
-                    if pd.notna(cell_value) and str(cell_value) in required_headers:
-                        header_locations[str(cell_value)] = (row_idx, col_idx)
+            # Match every cell against the headers at once; hits come back in
+            # row-major order so a later duplicate still overrides an earlier one
+            mask = df.isin(required_headers).to_numpy()
+            for row_idx, col_idx in zip(*np.nonzero(mask)):
+                header_locations[str(df.iat[row_idx, col_idx])] = (int(row_idx), int(col_idx))
             
             # Return only if all headers are found
             return header_locations if len(header_locations) == 4 else {}
@@ -90,47 +89,75 @@ class ComparisonService:
             DataFrame with added column
         """
         try:
-            df_copy = df.copy()
-            
-            # Get header positions
-            referral_only_row, referral_only_col = header_locations[MatrixHeaders.REFERRAL_ONLY]
-            oto_and_referral_row, oto_and_referral_col = header_locations[MatrixHeaders.OTO_AND_REFERRAL]
-            
             # Position for new column (after OTO and Referral)
-            new_col_position = oto_and_referral_col + 1
-            
-            # Ensure dataframe has enough columns
-            while new_col_position >= len(df_copy.columns):
-                df_copy[len(df_copy.columns)] = None
-            
-            # Add header
-            df_copy.iloc[referral_only_row, new_col_position] = MatrixHeaders.CURRENT_REFERRAL
-            
-            # Calculate values for each row
-            for row_idx in range(referral_only_row + 1, len(df_copy)):
-                referral_only_value = df_copy.iloc[row_idx, referral_only_col]
-                oto_and_referral_value = df_copy.iloc[row_idx, oto_and_referral_col]
-                
-                # Convert to numeric, handling NaN and string values
-                try:
-                    referral_only_value = 0 if pd.isna(referral_only_value) else float(referral_only_value)
-                except (ValueError, TypeError):
-                    referral_only_value = 0
-                
-                try:
-                    oto_and_referral_value = 0 if pd.isna(oto_and_referral_value) else float(oto_and_referral_value)
-                except (ValueError, TypeError):
-                    oto_and_referral_value = 0
-                
-                # Calculate sum (now guaranteed to be numeric)
-                current_referral = referral_only_value + oto_and_referral_value
-                df_copy.iloc[row_idx, new_col_position] = current_referral
+            new_col_position = header_locations[MatrixHeaders.OTO_AND_REFERRAL][1] + 1
+            
+            # Copy once, with enough columns for the new one
+            df_copy = self._padded_copy(df, new_col_position + 1)
+            self._fill_current_referral_column(df_copy, header_locations)
             
             return df_copy
             
         except Exception as e:
             raise DataProcessingError(f"Error adding current referral column: {str(e)}")
     
+    def _fill_current_referral_column(self, df: pd.DataFrame,
+                                      header_locations: Dict[str, Tuple[int, int]]) -> None:
+        """
+        Write the 'Current Referral' header and values into an already padded dataframe.
+        
+        Args:
+            df: Dataframe to update in place
+            header_locations: Dictionary with header positions
+        """
+        # Get header positions
+        referral_only_row, referral_only_col = header_locations[MatrixHeaders.REFERRAL_ONLY]
+        oto_and_referral_row, oto_and_referral_col = header_locations[MatrixHeaders.OTO_AND_REFERRAL]
+        new_col_position = oto_and_referral_col + 1
+        
+        # Add header
+        df.iat[referral_only_row, new_col_position] = MatrixHeaders.CURRENT_REFERRAL
+        
+        # Calculate values for all member rows at once
+        data_rows = slice(referral_only_row + 1, len(df))
+        current_referral = (
+            self._to_numeric(df.iloc[data_rows, referral_only_col]) +
+            self._to_numeric(df.iloc[data_rows, oto_and_referral_col])
+        )
+        df.iloc[data_rows, new_col_position] = current_referral.to_numpy(dtype=object)
+    
+    def _padded_copy(self, df: pd.DataFrame, column_count: int) -> pd.DataFrame:
+        """
+        Copy a dataframe, appending empty columns until it has at least column_count columns.
+        
+        Args:
+            df: Dataframe with positional column labels
+            column_count: Minimum number of columns required
+            
+        Returns:
+            New dataframe that can be modified without touching the source
+        """
+        if column_count <= len(df.columns):
+            return df.copy()
+        
+        # Add every missing column in one concat, which also makes the copy
+        padding = pd.DataFrame(
+            None, index=df.index, columns=range(len(df.columns), column_count), dtype=object
+        )
+        return pd.concat([df, padding], axis=1)
+    
+    def _to_numeric(self, values: pd.Series) -> pd.Series:
+        """
+        Convert matrix cell values to floats, treating blank and non-numeric cells as 0.
+        
+        Args:
+            values: Column slice of matrix cells
+            
+        Returns:
+            Series of floats
+        """
+        return pd.to_numeric(values, errors='coerce').fillna(0).astype(float)
+    
     def add_comparison_columns(self, new_df: pd.DataFrame, old_df: pd.DataFrame,
                              new_headers: Dict[str, Tuple[int, int]], 
                              old_headers: Dict[str, Tuple[int, int]]) -> pd.DataFrame:
@@ -147,12 +174,6 @@ class ComparisonService:
             DataFrame with comparison columns added
         """
         try:
-            result_df = new_df.copy()
-            
-            # Add Current Referral column to both matrices if not already present
-            result_df = self.add_current_referral_column(result_df, new_headers)
-            old_df_with_current = self.add_current_referral_column(old_df, old_headers)
-            
             # Get positions
             new_oto_referral_row, new_oto_referral_col = new_headers[MatrixHeaders.OTO_AND_REFERRAL]
             old_oto_referral_row, old_oto_referral_col = old_headers[MatrixHeaders.OTO_AND_REFERRAL]
@@ -164,17 +185,21 @@ class ComparisonService:
             last_neither_col = change_referral_col + 1
             change_neither_col = last_neither_col + 1
             
-            # Ensure enough columns
-            while change_neither_col >= len(result_df.columns):
-                result_df[len(result_df.columns)] = None
+            # Copy the new matrix once, wide enough for every added column, and
+            # add Current Referral to it in place
+            result_df = self._padded_copy(new_df, change_neither_col + 1)
+            self._fill_current_referral_column(result_df, new_headers)
+            
+            # The old matrix only needs Current Referral for the lookup below
+            old_df_with_current = self.add_current_referral_column(old_df, old_headers)
             
             # Add headers
-            result_df.iloc[new_oto_referral_row, last_referral_col] = MatrixHeaders.LAST_REFERRAL
-            result_df.iloc[new_oto_referral_row, change_referral_col] = MatrixHeaders.CHANGE_IN_REFERRALS
-            result_df.iloc[new_oto_referral_row, last_neither_col] = MatrixHeaders.LAST_NEITHER
-            result_df.iloc[new_oto_referral_row, change_neither_col] = MatrixHeaders.CHANGE_IN_NEITHER
+            result_df.iat[new_oto_referral_row, last_referral_col] = MatrixHeaders.LAST_REFERRAL
+            result_df.iat[new_oto_referral_row, change_referral_col] = MatrixHeaders.CHANGE_IN_REFERRALS
+            result_df.iat[new_oto_referral_row, last_neither_col] = MatrixHeaders.LAST_NEITHER
+            result_df.iat[new_oto_referral_row, change_neither_col] = MatrixHeaders.CHANGE_IN_NEITHER
             
-            # Create lookup dictionaries for old matrix values
+            # Create name-indexed lookups for old matrix values
             old_referral_lookup = self._create_member_value_lookup(
                 old_df_with_current, old_oto_referral_row, old_oto_referral_col + 1
             )
@@ -182,51 +207,30 @@ class ComparisonService:
                 old_df, old_neither_row, old_neither_col
             )
             
-            # Fill comparison columns
-            for row_idx in range(new_oto_referral_row + 1, len(result_df)):
-                member_name = result_df.iloc[row_idx, 0]
-                if pd.notna(member_name):
-                    normalized_name = self._normalize_member_name(member_name)
-                    
-                    # Get current values
-                    current_referral = result_df.iloc[row_idx, current_referral_col]
-                    current_neither = result_df.iloc[row_idx, new_headers[MatrixHeaders.NEITHER][1]]
-                    
-                    # Convert to numeric, defaulting to 0 for any non-numeric values
-                    try:
-                        current_referral = 0 if pd.isna(current_referral) else float(current_referral)
-                    except (ValueError, TypeError):
-                        current_referral = 0
-                    
-                    try:
-                        current_neither = 0 if pd.isna(current_neither) else float(current_neither)
-                    except (ValueError, TypeError):
-                        current_neither = 0
-                    
-                    # Get last values and ensure they're numeric
-                    last_referral = old_referral_lookup.get(normalized_name, 0)
-                    last_neither = old_neither_lookup.get(normalized_name, 0)
-                    
-                    try:
-                        last_referral = float(last_referral) if last_referral is not None else 0
-                    except (ValueError, TypeError):
-                        last_referral = 0
-                    
-                    try:
-                        last_neither = float(last_neither) if last_neither is not None else 0
-                    except (ValueError, TypeError):
-                        last_neither = 0
-                    
-                    # Fill last values
-                    result_df.iloc[row_idx, last_referral_col] = last_referral
-                    result_df.iloc[row_idx, last_neither_col] = last_neither
-                    
-                    # Calculate and fill changes
-                    referral_change = current_referral - last_referral
-                    neither_change = current_neither - last_neither
-                    
-                    result_df.iloc[row_idx, change_referral_col] = self._format_change_value(referral_change)
-                    result_df.iloc[row_idx, change_neither_col] = self._format_change_value(neither_change)
+            # Work on the named member rows only; unnamed rows are left untouched
+            data_start = new_oto_referral_row + 1
+            member_names = result_df.iloc[data_start:, 0]
+            has_name = member_names.notna().to_numpy()
+            member_rows = data_start + np.flatnonzero(has_name)
+            
+            # Look up last values for every named member row at once
+            normalized_names = self._normalize_member_names(member_names[has_name])
+            last_referrals = normalized_names.map(old_referral_lookup).fillna(0).to_numpy(dtype=float)
+            last_neithers = normalized_names.map(old_neither_lookup).fillna(0).to_numpy(dtype=float)
+            
+            current_referrals = self._to_numeric(
+                result_df.iloc[member_rows, current_referral_col]
+            ).to_numpy()
+            current_neithers = self._to_numeric(
+                result_df.iloc[member_rows, new_headers[MatrixHeaders.NEITHER][1]]
+            ).to_numpy()
+            
+            # Fill all four comparison columns in a single assignment
+            result_df.iloc[member_rows, last_referral_col:change_neither_col + 1] = (
+                self._build_comparison_block(
+                    current_referrals, last_referrals, current_neithers, last_neithers
+                )
+            )
             
             return result_df
             
@@ -258,10 +262,22 @@ class ComparisonService:
         
         return normalized
     
+    def _normalize_member_names(self, names: pd.Series) -> pd.Series:
+        """
+        Normalize a column of member names the same way as _normalize_member_name.
+        
+        Args:
+            names: Series of non-null member names
+            
+        Returns:
+            Series of normalized names for matching
+        """
+        return names.astype(str).str.lower().str.replace(r'[^a-z0-9]', '', regex=True)
+    
     def _create_member_value_lookup(self, df: pd.DataFrame, start_row: int, 
-                                  value_col: int) -> Dict[str, Any]:
+                                  value_col: int) -> pd.Series:
         """
-        Create a lookup dictionary mapping member names to their values.
+        Create a lookup series mapping member names to their values.
         
         Args:
             df: Source dataframe
@@ -269,51 +285,56 @@ class ComparisonService:
             value_col: Column containing the values
             
         Returns:
-            Dictionary mapping normalized names to values
+            Series of values indexed by unique normalized names, ready for Series.map
         """
         try:
-            lookup = {}
+            member_names = df.iloc[start_row + 1:, 0]  # Assuming names are in column 0
+            has_name = member_names.notna()
             
-            for row_idx in range(start_row + 1, len(df)):
-                member_name = df.iloc[row_idx, 0]  # Assuming names are in column 0
-                if pd.notna(member_name):
-                    value = df.iloc[row_idx, value_col]
-                    # Convert to numeric, defaulting to 0 for any non-numeric values
-                    if pd.isna(value):
-                        value = 0
-                    else:
-                        try:
-                            value = float(value)
-                        except (ValueError, TypeError):
-                            value = 0
-                    normalized_name = self._normalize_member_name(member_name)
-                    lookup[normalized_name] = value
+            normalized_names = self._normalize_member_names(member_names[has_name])
+            values = self._to_numeric(df.iloc[start_row + 1:, value_col][has_name])
+            lookup = pd.Series(values.to_numpy(), index=pd.Index(normalized_names.to_numpy()))
             
-            return lookup
+            # Later rows win for the same normalized name
+            return lookup[~lookup.index.duplicated(keep='last')]
             
         except Exception as e:
             raise DataProcessingError(f"Error creating member value lookup: {str(e)}")
     
-    def _format_change_value(self, change: float) -> str:
+    def _build_comparison_block(self, current_referrals: np.ndarray, last_referrals: np.ndarray,
+                                current_neithers: np.ndarray, last_neithers: np.ndarray) -> np.ndarray:
         """
-        Format a change value with appropriate indicators.
+        Build the Last Referral, Change in Referrals, Last Neither and Change in Neither columns.
         
         Args:
-            change: The change value
+            current_referrals: Current referral totals per member row
+            last_referrals: Referral totals from the old matrix per member row
+            current_neithers: Current 'Neither' counts per member row
+            last_neithers: 'Neither' counts from the old matrix per member row
             
         Returns:
-            Formatted string with change indicators
+            Object array of shape (rows, 4) ready to assign to the comparison columns
         """
-        try:
-            if change > 0:
-                return f"+{change} ↗️"
-            elif change < 0:
-                return f"{change} ↘️"
-            else:
-                return f"{change} ➡️"
-                
-        except Exception:
-            return "0 ➡️"
+        block = np.empty((len(current_referrals), 4), dtype=object)
+        block[:, 0] = last_referrals.tolist()
+        block[:, 1] = self._format_change_values(current_referrals - last_referrals)
+        block[:, 2] = last_neithers.tolist()
+        block[:, 3] = self._format_change_values(current_neithers - last_neithers)
+        return block
+    
+    def _format_change_values(self, changes: np.ndarray) -> List[str]:
+        """
+        Format change values with appropriate indicators.
+        
+        Args:
+            changes: Array of change values
+            
+        Returns:
+            Formatted strings with change indicators
+        """
+        signs = np.where(changes > 0, '+', '')
+        arrows = np.where(changes > 0, ' ↗️', np.where(changes < 0, ' ↘️', ' ➡️'))
+        return np.char.add(np.char.add(signs, changes.astype(str)), arrows).tolist()
     
     def generate_comparison_report(self, new_matrix_path: Path, 
                                  old_matrix_path: Path) -> pd.DataFrame:
@@ -352,24 +373,35 @@ class ComparisonService:
             output_path: Path where to save the Excel file
         """
         try:
-            # Create workbook
-            workbook = self.excel_handler.create_styled_workbook()
-            worksheet = workbook.active
-            worksheet.title = "Combination Matrix Comparison"
-            
-            # Write data to worksheet
-            for row_idx, row_data in enumerate(comparison_df.values, start=1):
-                for col_idx, value in enumerate(row_data, start=1):
-                    worksheet.cell(row=row_idx, column=col_idx, value=value)
-            
-            # Apply styling
-            data_range = {
-                'max_row': len(comparison_df),
-                'max_col': len(comparison_df.columns)
-            }
+            # Create workbook; cells are styled as they are written rather than
+            # in a second pass over the finished sheet
+            workbook = self.excel_handler.create_styled_workbook(write_only=True)
+            self.excel_handler.register_matrix_styles(workbook)
+            worksheet = workbook.create_sheet("Combination Matrix Comparison")
+            
+            # Measure widths on the whole frame at once
+            tracker = ColumnWidthTracker()
+            tracker.observe_frame(comparison_df)
+            styled_rows = []
+            
+            for row_idx, row_data in enumerate(comparison_df.values.tolist()):
+                cells = []
+                for col_idx, value in enumerate(row_data):
+                    if row_idx == 0:
+                        style = MATRIX_HEADER_STYLE
+                    elif col_idx == 0:
+                        style = MATRIX_LABEL_STYLE
+                    else:
+                        style = MATRIX_ZERO_STYLE if value == 0 else MATRIX_VALUE_STYLE
+                    cell = WriteOnlyCell(worksheet, value=value)
+                    cell.style = style
+                    cells.append(cell)
+                styled_rows.append(cells)
             
-            self.excel_handler.apply_matrix_styling(worksheet, data_range, highlight_zeros=True)
-            self.excel_handler.auto_adjust_column_widths(worksheet)
+            # Write-only sheets need their widths before the first row
+            self.excel_handler.apply_column_widths(worksheet, tracker)
+            for cells in styled_rows:
+                worksheet.append(cells)
             
             # Save workbook
             self.excel_handler.save_workbook(workbook, output_path)
@@ -403,36 +435,37 @@ class ComparisonService:
             # Find change columns
             header_row = headers[MatrixHeaders.OTO_AND_REFERRAL][0]
             
+            # Locate the change column once from the header row
+            change_col = None
+            if header_row < len(comparison_df):
+                for col_idx, header_val in enumerate(comparison_df.iloc[header_row].tolist()):
+                    if pd.notna(header_val) and MatrixHeaders.CHANGE_IN_REFERRALS in str(header_val):
+                        change_col = col_idx
+                        break
+            
             # Count members and analyze changes
             member_changes = []
+            member_names = comparison_df.iloc[header_row + 1:, 0].tolist()
+            change_values = (
+                comparison_df.iloc[header_row + 1:, change_col].tolist()
+                if change_col is not None else [None] * len(member_names)
+            )
             
-            for row_idx in range(header_row + 1, len(comparison_df)):
-                member_name = comparison_df.iloc[row_idx, 0]
+            for member_name, change_str in zip(member_names, change_values):
                 if pd.notna(member_name):
                     insights['total_members'] += 1
                     
-                    # Extract change values (assuming specific column positions)
-                    # This would need to be adjusted based on actual column positions
-                    change_col = None
-                    for col_idx in range(len(comparison_df.columns)):
-                        header_val = comparison_df.iloc[header_row, col_idx]
-                        if pd.notna(header_val) and MatrixHeaders.CHANGE_IN_REFERRALS in str(header_val):
-                            change_col = col_idx
-                            break
-                    
-                    if change_col is not None:
-                        change_str = comparison_df.iloc[row_idx, change_col]
-                        if pd.notna(change_str):
-                            # Parse change value
-                            change_val = self._parse_change_value(str(change_str))
-                            member_changes.append((str(member_name), change_val))
-                            
-                            if change_val > 0:
-                                insights['improved_members'] += 1
-                            elif change_val < 0:
-                                insights['declined_members'] += 1
-                            else:
-                                insights['unchanged_members'] += 1
+                    if change_col is not None and pd.notna(change_str):
+                        # Parse change value
+                        change_val = self._parse_change_value(str(change_str))
+                        member_changes.append((str(member_name), change_val))
+                        
+                        if change_val > 0:
+                            insights['improved_members'] += 1
+                        elif change_val < 0:
+                            insights['declined_members'] += 1
+                        else:
+                            insights['unchanged_members'] += 1
             
             # Get top improvements and declines
             member_changes.sort(key=lambda x: x[1], reverse=True)
@@ -1,7 +1,7 @@
 """Service for generating and managing analysis matrices."""
 
 from typing import List, Dict, Set
-from collections import defaultdict
+from collections import Counter, defaultdict
 
 from src.domain.models.member import Member
 from src.domain.models.referral import Referral
@@ -131,38 +131,28 @@ class MatrixService:
         try:
             members = referral_matrix.get_all_members()
             
-            # Initialize matrix with zeros
-            matrix_data = {
-                giver: {receiver: 0 for receiver in members} 
-                for giver in members
-            }
-            
-            # Generate combination values
+            # Generate combination values, encoding each pair's flags directly
+            encode = CombinationValues.encode
+            matrix_data = {}
             for giver in members:
-                for receiver in members:
-                    referral_count = referral_matrix.get_cell_value(giver, receiver)
-                    oto_count = one_to_one_matrix.get_cell_value(giver, receiver)
-                    
-                    if referral_count > 0 and oto_count > 0:
-                        matrix_data[giver][receiver] = CombinationValues.BOTH
-                    elif referral_count > 0:
-                        matrix_data[giver][receiver] = CombinationValues.REFERRAL_ONLY
-                    elif oto_count > 0:
-                        matrix_data[giver][receiver] = CombinationValues.OTO_ONLY
-                    else:
-                        matrix_data[giver][receiver] = CombinationValues.NEITHER
+                referral_row = referral_matrix.get_row(giver)
+                oto_row = one_to_one_matrix.get_row(giver)
+                matrix_data[giver] = {
+                    receiver: encode(oto_row.get(receiver, 0) > 0, referral_row.get(receiver, 0) > 0)
+                    for receiver in members
+                }
             
             # Calculate member statistics
             member_stats = {}
             for member in members:
                 stats = MemberStatistics(member=member)
                 
-                # Count combination types
-                row_data = matrix_data[member]
-                stats.neither_count = sum(1 for value in row_data.values() if value == CombinationValues.NEITHER)
-                stats.oto_only_count = sum(1 for value in row_data.values() if value == CombinationValues.OTO_ONLY)
-                stats.referral_only_count = sum(1 for value in row_data.values() if value == CombinationValues.REFERRAL_ONLY)
-                stats.both_count = sum(1 for value in row_data.values() if value == CombinationValues.BOTH)
+                # Count combination types in a single pass over the row
+                counts = Counter(matrix_data[member].values())
+                stats.neither_count = counts[CombinationValues.NEITHER]
+                stats.oto_only_count = counts[CombinationValues.OTO_ONLY]
+                stats.referral_only_count = counts[CombinationValues.REFERRAL_ONLY]
+                stats.both_count = counts[CombinationValues.BOTH]
                 
                 member_stats[member] = stats
             
@@ -91,32 +91,7 @@ class TYFCBService:
             Dictionary mapping members to their TYFCB statistics
         """
         try:
-            # Initialize statistics for all members
-            member_stats = {member: TYFCBStatistics(member=member) for member in members}
-            
-            # Process each TYFCB entry
-            for tyfcb in tyfcbs:
-                # Update giver statistics (only if giver is specified)
-                if tyfcb.giver and tyfcb.giver in member_stats:
-                    stats = member_stats[tyfcb.giver]
-                    if tyfcb.within_chapter:
-                        stats.total_given_within_chapter += tyfcb.amount
-                        stats.count_given_within_chapter += 1
-                    else:
-                        stats.total_given_outside_chapter += tyfcb.amount
-                        stats.count_given_outside_chapter += 1
-                
-                # Update receiver statistics (primary focus for TYFCB)
-                if tyfcb.receiver in member_stats:
-                    stats = member_stats[tyfcb.receiver]
-                    if tyfcb.within_chapter:
-                        stats.total_received_within_chapter += tyfcb.amount
-                        stats.count_received_within_chapter += 1
-                    else:
-                        stats.total_received_outside_chapter += tyfcb.amount
-                        stats.count_received_outside_chapter += 1
-            
-            return member_stats
+            return self._accumulate(members, tyfcbs).member_statistics
             
         except Exception as e:
             raise DataProcessingError(f"Error calculating TYFCB member statistics: {str(e)}")
@@ -133,25 +108,60 @@ class TYFCBService:
             TYFCBSummary with complete statistics
         """
         try:
-            # Calculate member statistics
-            member_statistics = self.calculate_member_statistics(members, tyfcbs)
-            
-            # Calculate totals
-            summary = TYFCBSummary(member_statistics=member_statistics)
-            
-            for tyfcb in tyfcbs:
-                if tyfcb.within_chapter:
-                    summary.total_amount_within_chapter += tyfcb.amount
-                    summary.total_count_within_chapter += 1
-                else:
-                    summary.total_amount_outside_chapter += tyfcb.amount
-                    summary.total_count_outside_chapter += 1
-            
-            return summary
+            return self._accumulate(members, tyfcbs)
             
         except Exception as e:
             raise DataProcessingError(f"Error generating TYFCB summary: {str(e)}")
     
+    def _accumulate(self, members: List[Member], tyfcbs: List[TYFCB]) -> TYFCBSummary:
+        """
+        Build member statistics and chapter totals in a single pass over the entries.
+        
+        Args:
+            members: List of all members
+            tyfcbs: List of all TYFCB entries
+            
+        Returns:
+            TYFCBSummary with member statistics and totals
+        """
+        # Initialize statistics for all members
+        member_stats = {member: TYFCBStatistics(member=member) for member in members}
+        summary = TYFCBSummary(member_statistics=member_stats)
+        
+        # Process each TYFCB entry
+        for tyfcb in tyfcbs:
+            amount = tyfcb.amount
+            giver = tyfcb.giver
+            giver_stats = member_stats.get(giver) if giver else None
+            receiver_stats = member_stats.get(tyfcb.receiver)
+            
+            if tyfcb.within_chapter:
+                summary.total_amount_within_chapter += amount
+                summary.total_count_within_chapter += 1
+                
+                # Update giver statistics (only if giver is specified)
+                if giver_stats is not None:
+                    giver_stats.total_given_within_chapter += amount
+                    giver_stats.count_given_within_chapter += 1
+                
+                # Update receiver statistics (primary focus for TYFCB)
+                if receiver_stats is not None:
+                    receiver_stats.total_received_within_chapter += amount
+                    receiver_stats.count_received_within_chapter += 1
+            else:
+                summary.total_amount_outside_chapter += amount
+                summary.total_count_outside_chapter += 1
+                
+                if giver_stats is not None:
+                    giver_stats.total_given_outside_chapter += amount
+                    giver_stats.count_given_outside_chapter += 1
+                
+                if receiver_stats is not None:
+                    receiver_stats.total_received_outside_chapter += amount
+                    receiver_stats.count_received_outside_chapter += 1
+        
+        return summary
+    
     def get_top_performers(self, member_statistics: Dict[Member, TYFCBStatistics], 
                           by_given: bool = True, top_n: int = 5) -> List[tuple]:
         """
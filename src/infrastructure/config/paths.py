@@ -1,5 +1,6 @@
 """Path management utilities for the application."""
 
+import os
 from pathlib import Path
 from typing import List
 
@@ -38,10 +39,10 @@ class PathManager:
         return Path(self.settings.directories.old_matrix)
     
     def get_excel_files(self) -> List[Path]:
-        """Get all Excel files from the Excel files directory."""
+        """Get all PALMS data files (Excel or CSV) from the Excel files directory."""
         excel_files = []
         if self.excel_files_dir.exists():
-            for ext in self.settings.excel.supported_extensions:
+            for ext in self.settings.excel.palms_extensions:
                 excel_files.extend(self.excel_files_dir.glob(f"*{ext}"))
         return sorted(excel_files)
     
@@ -76,9 +77,11 @@ class PathManager:
     def cleanup_directory(self, directory: Path) -> None:
         """Remove all files from a directory."""
         if directory.exists():
-            for file_path in directory.iterdir():
-                if file_path.is_file():
-                    file_path.unlink()
+            # DirEntry.is_file() reuses the stat data gathered by the scan
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_file(follow_symlinks=False):
+                        os.unlink(entry.path)
     
     def cleanup_all_upload_directories(self) -> None:
         """Clean up all upload directories."""
@@ -33,12 +33,16 @@ class ExcelConfig:
     """Configuration for Excel file processing."""
     
     supported_extensions: List[str] = None
+    palms_extensions: List[str] = None
     max_file_size_mb: int = 50
     encoding: str = "utf-8"
     
     def __post_init__(self):
         if self.supported_extensions is None:
             self.supported_extensions = [".xls", ".xlsx"]
+        if self.palms_extensions is None:
+            # PALMS exports may also be delivered as CSV
+            self.palms_extensions = self.supported_extensions + [".csv"]
 
 
 @dataclass
@@ -1,15 +1,72 @@
 """Excel file handling utilities."""
 
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, BinaryIO, Union
 import pandas as pd
 from openpyxl import load_workbook, Workbook
-from openpyxl.styles import PatternFill, Border, Side, Alignment, Font
+from openpyxl.styles import PatternFill, Border, Side, Alignment, Font, NamedStyle
+from openpyxl.styles.fonts import DEFAULT_FONT
 from openpyxl.utils import get_column_letter
 
 from src.domain.exceptions.domain_exceptions import FileProcessingError
 from src.infrastructure.config.settings import get_settings
 
+# Named styles registered by ExcelHandler.register_matrix_styles
+MATRIX_HEADER_STYLE = "matrix_header"
+MATRIX_LABEL_STYLE = "matrix_label"
+MATRIX_VALUE_STYLE = "matrix_value"
+MATRIX_ZERO_STYLE = "matrix_zero"
+MATRIX_TOTAL_STYLE = "matrix_total"
+MATRIX_TOTAL_ZERO_STYLE = "matrix_total_zero"
+
+
+def _detect_xlsx_read_engine() -> str:
+    """Prefer the Rust-backed calamine reader when pandas and python-calamine support it."""
+    try:
+        import python_calamine  # noqa: F401
+    except ImportError:
+        return "openpyxl"
+    
+    # pandas added the calamine engine in 2.2
+    pandas_version = tuple(int(part) for part in pd.__version__.split(".")[:2])
+    return "calamine" if pandas_version >= (2, 2) else "openpyxl"
+
+
+# Engine used for pandas reads of .xlsx files
+XLSX_READ_ENGINE = _detect_xlsx_read_engine()
+
+
+class ColumnWidthTracker:
+    """Records the longest value per column as rows are built for writing."""
+    
+    __slots__ = ('max_lengths', 'column_count')
+    
+    def __init__(self):
+        self.max_lengths: Dict[int, int] = {}
+        self.column_count = 0
+    
+    def observe(self, column: int, value: Any) -> None:
+        """Record a value written to the given 1-based column."""
+        if column > self.column_count:
+            self.column_count = column
+        if value:
+            length = len(str(value))
+            if length > self.max_lengths.get(column, 0):
+                self.max_lengths[column] = length
+    
+    def observe_frame(self, df: pd.DataFrame) -> None:
+        """Record every value of a dataframe, its nth column becoming column n + 1."""
+        if len(df.columns) > self.column_count:
+            self.column_count = len(df.columns)
+        
+        # Blank and zero cells do not contribute, matching observe()
+        skipped = df.isna() | df.isin([0, ''])
+        lengths = df.astype(str).apply(lambda values: values.str.len()).mask(skipped, 0)
+        
+        for column, length in enumerate(lengths.max().fillna(0).astype(int).tolist(), start=1):
+            if length > self.max_lengths.get(column, 0):
+                self.max_lengths[column] = length
+
 
 class ExcelHandler:
     """Handles Excel file operations."""
@@ -41,7 +98,7 @@ class ExcelHandler:
                             from src.infrastructure.data.file_handlers.file_converter import FileConverter
                             converter = FileConverter()
                             xlsx_path = converter.ensure_xlsx_format(file_path, delete_original=False)
-                            return pd.read_excel(xlsx_path, **default_params)
+                            return pd.read_excel(xlsx_path, engine=XLSX_READ_ENGINE, **default_params)
                 except:
                     pass
                 
@@ -53,112 +110,121 @@ class ExcelHandler:
                     # If xlrd fails, try openpyxl
                     return pd.read_excel(file_path, engine='openpyxl', **default_params)
             else:
-                # For .xlsx files, use default behavior
-                return pd.read_excel(file_path, **default_params)
+                # For .xlsx files, use the fastest available reader
+                return pd.read_excel(file_path, engine=XLSX_READ_ENGINE, **default_params)
             
         except Exception as e:
             raise FileProcessingError(f"Error reading Excel file {file_path}: {str(e)}")
     
-    def read_excel_with_openpyxl(self, file_path: Path) -> Any:
-        """Read an Excel file using openpyxl for more control."""
+    def read_excel_with_openpyxl(self, file_path: Path, read_only: bool = False,
+                                 data_only: bool = False) -> Any:
+        """
+        Read an Excel file using openpyxl for more control.
+        
+        Args:
+            file_path: Path to the Excel file
+            read_only: Stream rows without building the cell grid; the caller
+                must close the workbook when done
+            data_only: Read cached formula results instead of formulas
+        """
         try:
             if not file_path.exists():
                 raise FileProcessingError(f"File not found: {file_path}")
             
-            return load_workbook(file_path)
+            return load_workbook(file_path, read_only=read_only, data_only=data_only)
             
         except Exception as e:
             raise FileProcessingError(f"Error reading Excel file {file_path}: {str(e)}")
     
-    def create_styled_workbook(self) -> Workbook:
-        """Create a new workbook with default styling."""
-        return Workbook()
+    def create_styled_workbook(self, write_only: bool = False) -> Workbook:
+        """
+        Create a new workbook with default styling.
+        
+        Args:
+            write_only: Create a streaming workbook whose sheets only accept
+                rows appended in order
+        """
+        return Workbook(write_only=write_only)
     
-    def apply_matrix_styling(self, worksheet, data_range: Dict[str, int], 
-                           highlight_zeros: bool = True) -> None:
-        """Apply standard matrix styling to a worksheet."""
+    def register_matrix_styles(self, workbook: Workbook) -> None:
+        """
+        Register the standard matrix styles on a workbook as named styles.
+        
+        Write-only worksheets cannot be styled after their rows are written, so
+        matrix cells reference these styles by name as they are appended.
+        
+        Args:
+            workbook: Workbook to register the styles on
+        """
         try:
-            # Define styles
+            matrix_settings = self.settings.matrix
+            side = Side(style=matrix_settings.border_style)
+            border_style = Border(left=side, right=side, top=side, bottom=side)
             zero_fill = PatternFill(
-                start_color=self.settings.matrix.zero_highlight_color,
-                end_color=self.settings.matrix.zero_highlight_color,
+                start_color=matrix_settings.zero_highlight_color,
+                end_color=matrix_settings.zero_highlight_color,
                 fill_type="solid"
             )
-            border_style = Border(
-                left=Side(style=self.settings.matrix.border_style),
-                right=Side(style=self.settings.matrix.border_style),
-                top=Side(style=self.settings.matrix.border_style),
-                bottom=Side(style=self.settings.matrix.border_style)
-            )
             center_align = Alignment(
-                horizontal=self.settings.matrix.text_alignment,
-                vertical=self.settings.matrix.text_alignment
+                horizontal=matrix_settings.text_alignment,
+                vertical=matrix_settings.text_alignment
             )
             rotated_align = Alignment(
-                horizontal=self.settings.matrix.text_alignment,
-                vertical=self.settings.matrix.text_alignment,
-                textRotation=self.settings.matrix.header_text_rotation
+                horizontal=matrix_settings.text_alignment,
+                vertical=matrix_settings.text_alignment,
+                textRotation=matrix_settings.header_text_rotation
             )
-            bold_font = Font(bold=self.settings.matrix.header_bold)
-            
-            # Apply styling to all cells in the range
-            for row in range(1, data_range['max_row'] + 1):
-                for col in range(1, data_range['max_col'] + 1):
-                    cell = worksheet.cell(row=row, column=col)
-                    
-                    # Apply border and alignment
-                    cell.border = border_style
-                    cell.alignment = center_align
-                    
-                    # Style headers
-                    if row == 1:
-                        cell.alignment = rotated_align
-                        cell.font = bold_font
-                    
-                    if col == 1 and row > 1:
-                        cell.font = bold_font
-                    
-                    # Highlight zero values if requested
-                    if (highlight_zeros and row > 1 and col > 1 and 
-                        cell.value is not None and cell.value == 0):
-                        cell.fill = zero_fill
+            bold_font = Font(bold=matrix_settings.header_bold)
+            total_font = Font(bold=True)
+            
+            styles = {
+                MATRIX_HEADER_STYLE: {'font': bold_font, 'alignment': rotated_align},
+                MATRIX_LABEL_STYLE: {'font': bold_font, 'alignment': center_align},
+                MATRIX_VALUE_STYLE: {'font': DEFAULT_FONT, 'alignment': center_align},
+                MATRIX_ZERO_STYLE: {'font': DEFAULT_FONT, 'alignment': center_align, 'fill': zero_fill},
+                MATRIX_TOTAL_STYLE: {'font': total_font, 'alignment': center_align},
+                MATRIX_TOTAL_ZERO_STYLE: {'font': total_font, 'alignment': center_align, 'fill': zero_fill},
+            }
+            for name, attributes in styles.items():
+                workbook.add_named_style(NamedStyle(name=name, border=border_style, **attributes))
             
         except Exception as e:
-            raise FileProcessingError(f"Error applying styling: {str(e)}")
+            raise FileProcessingError(f"Error registering matrix styles: {str(e)}")
     
-    def auto_adjust_column_widths(self, worksheet, max_width: Optional[int] = None) -> None:
-        """Auto-adjust column widths based on content."""
+    def apply_column_widths(self, worksheet, tracker: 'ColumnWidthTracker',
+                            max_width: Optional[int] = None) -> None:
+        """
+        Set column widths from the lengths recorded while rows were built.
+        
+        Write-only worksheets emit their column layout with the first row, so
+        this must run before any row is appended.
+        
+        Args:
+            worksheet: Worksheet to size
+            tracker: Tracker that observed every value about to be written
+            max_width: Optional cap on the data column width
+        """
         try:
             max_width = max_width or self.settings.matrix.max_column_width
             
-            for column in worksheet.columns:
-                max_length = 0
-                column_letter = column[0].column_letter
-                
-                for cell in column:
-                    try:
-                        if cell.value:
-                            max_length = max(max_length, len(str(cell.value)))
-                    except:
-                        pass
-                
-                adjusted_width = min(
-                    max_length + self.settings.matrix.data_column_width_buffer,
+            for column in range(1, tracker.column_count + 1):
+                worksheet.column_dimensions[get_column_letter(column)].width = min(
+                    tracker.max_lengths.get(column, 0) + self.settings.matrix.data_column_width_buffer,
                     max_width
                 )
-                worksheet.column_dimensions[column_letter].width = adjusted_width
             
             # Set first column to standard name width
             worksheet.column_dimensions['A'].width = self.settings.matrix.name_column_width
             
         except Exception as e:
-            raise FileProcessingError(f"Error adjusting column widths: {str(e)}")
+            raise FileProcessingError(f"Error setting column widths: {str(e)}")
     
-    def save_workbook(self, workbook: Workbook, file_path: Path) -> None:
-        """Save a workbook to a file."""
+    def save_workbook(self, workbook: Workbook, file_path: Union[Path, BinaryIO]) -> None:
+        """Save a workbook to a file, or to a writable binary buffer such as BytesIO."""
         try:
             # Ensure the directory exists
-            file_path.parent.mkdir(parents=True, exist_ok=True)
+            if isinstance(file_path, Path):
+                file_path.parent.mkdir(parents=True, exist_ok=True)
             workbook.save(file_path)
             
         except Exception as e:
@@ -225,8 +291,8 @@ class ExcelHandler:
                     except Exception:
                         return True  # Allow XML-based files to pass validation
             else:
-                # For .xlsx files, use default pandas behavior
-                pd.read_excel(file_path, nrows=1)
+                # For .xlsx files, use the fastest available reader
+                pd.read_excel(file_path, nrows=1, engine=XLSX_READ_ENGINE)
                 return True
             
         except Exception:
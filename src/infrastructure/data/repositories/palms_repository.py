@@ -2,6 +2,11 @@
 
 from pathlib import Path
 from typing import List, Tuple, Optional
+import codecs
+import csv
+from functools import lru_cache
+from itertools import chain, islice
+from operator import itemgetter
 import pandas as pd
 from openpyxl import load_workbook
 
@@ -10,11 +15,42 @@ from src.domain.models.referral import Referral
 from src.domain.models.one_to_one import OneToOne
 from src.domain.models.tyfcb import TYFCB
 from src.domain.exceptions.domain_exceptions import DataProcessingError
-from src.shared.constants.app_constants import SlipType, ExcelColumns
+from src.shared.constants.app_constants import (
+    ExcelColumns, SLIP_TYPE_LOOKUP, SLIP_REFERRAL, SLIP_ONE_TO_ONE, SLIP_TYFCB
+)
 from src.infrastructure.data.file_handlers.excel_handler import ExcelHandler
 from src.infrastructure.data.file_handlers.file_converter import FileConverter
 from src.infrastructure.config.paths import get_path_manager
 
+# Upper-cased slip type spellings (canonical values and common variations)
+# mapped to their canonical value
+_SLIP_TYPE_VARIANTS = {
+    **{slip.upper(): slip for slip in (SLIP_REFERRAL, SLIP_ONE_TO_ONE, SLIP_TYFCB)},
+    **dict.fromkeys(['TYFCB', 'TY FCB', 'TY-FCB', 'THANK YOU FCB', 'THANK YOU FOR CLOSE BUSINESS'], SLIP_TYFCB),
+    **dict.fromkeys(['ONE TO ONE', 'ONE-TO-ONE', '1-TO-1', '1 TO 1', 'OTO', 'ONE2ONE'], SLIP_ONE_TO_ONE),
+    **dict.fromkeys(['REFERRAL', 'REF', 'REFERRALS'], SLIP_REFERRAL),
+}
+
+# Encoding tried for CSV files that are not valid in the configured encoding
+CSV_FALLBACK_ENCODING = 'cp1252'
+
+
+@lru_cache(maxsize=256)
+def _normalize_slip_type_text(slip_type: str) -> Optional[str]:
+    """
+    Map a raw slip type string to its canonical value, or None if unrecognized.
+    
+    PALMS files repeat a handful of spellings on every row, so results are cached.
+    """
+    # Check for exact matches first; most rows already use the canonical value
+    exact_match = SLIP_TYPE_LOOKUP.get(slip_type)
+    if exact_match is not None:
+        return exact_match.value
+    
+    # Otherwise match case-insensitively, ignoring surrounding whitespace,
+    # against the known spellings
+    return _SLIP_TYPE_VARIANTS.get(slip_type.strip().upper())
+
 
 class PalmsRepository:
     """Repository for accessing PALMS data from Excel files."""
@@ -27,22 +63,34 @@ class PalmsRepository:
     def extract_palms_data_from_file(self, file_path: Path, 
                                    members: List[Member]) -> Tuple[List[Referral], List[OneToOne], List[TYFCB]]:
         """
-        Extract referrals, one-to-one, and TYFCB data from a PALMS Excel file.
+        Extract referrals, one-to-one, and TYFCB data from a PALMS Excel or CSV file.
         
         Args:
-            file_path: Path to the PALMS Excel file
+            file_path: Path to the PALMS Excel or CSV file
             members: List of valid members to match against
             
         Returns:
             Tuple of (referrals, one_to_ones, tyfcbs)
         """
+        workbook = None
         try:
-            # Ensure file is in xlsx format
-            xlsx_path = self.file_converter.ensure_xlsx_format(file_path)
-            
-            # Load the workbook using openpyxl for better control
-            workbook = self.excel_handler.read_excel_with_openpyxl(xlsx_path)
-            sheet = workbook.active
+            if file_path.suffix.lower() == '.csv':
+                # CSV exports can be read directly without any Excel engine
+                rows = self._read_csv_rows(file_path)
+            else:
+                # Ensure file is in xlsx format
+                xlsx_path = self.file_converter.ensure_xlsx_format(file_path)
+                
+                # Stream the rows in read-only mode; no cell grid is built
+                workbook = self.excel_handler.read_excel_with_openpyxl(
+                    xlsx_path, read_only=True, data_only=True
+                )
+                worksheet = workbook.active
+                
+                # Read-only sheets trust the stored dimensions, which some
+                # exporters write incorrectly, so read every row instead
+                worksheet.reset_dimensions()
+                rows = worksheet.iter_rows(values_only=True)
             
             referrals = []
             one_to_ones = []
@@ -51,17 +99,42 @@ class PalmsRepository:
             # Create a lookup dictionary for members
             member_lookup = {member.normalized_name: member for member in members}
             
+            # Build a C-level column extractor once for this file's layout; short
+            # rows are padded so neither it nor the amount and detail lookups
+            # need per-field bounds checks
+            row_width = max(ExcelColumns) + 1
+            get_slip_fields = itemgetter(
+                ExcelColumns.GIVER_NAME,
+                ExcelColumns.RECEIVER_NAME,
+                ExcelColumns.SLIP_TYPE
+            )
+            
+            # Dispatch table from normalized slip type to the row handler, so each
+            # row does one dict lookup instead of walking an if/elif chain
+            slip_handlers = {
+                SLIP_REFERRAL: lambda giver, receiver, row, amount: referrals.append(
+                    Referral(giver=giver, receiver=receiver)
+                ),
+                SLIP_ONE_TO_ONE: lambda giver, receiver, row, amount: one_to_ones.append(
+                    OneToOne(member1=giver, member2=receiver)
+                ),
+                SLIP_TYFCB: lambda giver, receiver, row, amount: self._append_tyfcb(
+                    tyfcbs, giver, receiver, amount, row[ExcelColumns.DETAIL]
+                ),
+            }
+            
             # Process each row in the sheet
-            for row_idx, row in enumerate(sheet.iter_rows(values_only=True), start=1):
+            for row_idx, row in enumerate(rows, start=1):
                 try:
                     # Skip header row or empty rows
                     if row_idx == 1 or not any(row):
                         continue
                     
+                    if len(row) < row_width:
+                        row = tuple(row) + (None,) * (row_width - len(row))
+                    
                     # Extract data from columns
-                    giver_name = row[ExcelColumns.GIVER_NAME.value] if len(row) > ExcelColumns.GIVER_NAME.value else None
-                    receiver_name = row[ExcelColumns.RECEIVER_NAME.value] if len(row) > ExcelColumns.RECEIVER_NAME.value else None
-                    slip_type = row[ExcelColumns.SLIP_TYPE.value] if len(row) > ExcelColumns.SLIP_TYPE.value else None
+                    giver_name, receiver_name, slip_type = get_slip_fields(row)
                     
                     # Basic validation - slip_type is always required
                     if not slip_type:
@@ -70,22 +143,39 @@ class PalmsRepository:
                     # Normalize slip type first to check if it's TYFCB
                     normalized_slip_type = self._normalize_slip_type(slip_type)
                     
+                    # Unrecognized slip types are never recorded, so skip the member lookups
+                    handle_slip = slip_handlers.get(normalized_slip_type)
+                    if handle_slip is None:
+                        continue
+                    is_tyfcb = normalized_slip_type == SLIP_TYFCB
+                    
                     # For TYFCB: only receiver_name is required (From field is empty)
                     # For others: both giver_name and receiver_name are required
-                    if normalized_slip_type == SlipType.TYFCB.value:
+                    tyfcb_amount = None
+                    if is_tyfcb:
                         if not receiver_name:
                             continue  # TYFCB needs receiver (who got the business)
+                        
+                        # Only entries with a valid amount are recorded, so reject
+                        # the rest before looking up members
+                        tyfcb_amount = self._parse_tyfcb_amount(row[ExcelColumns.TYFCB_AMOUNT])
+                        if tyfcb_amount <= 0:
+                            continue
                     else:
                         if not all([giver_name, receiver_name]):
                             continue  # Referrals and OTOs need both giver and receiver
                     
-                    # Normalize names and find members
-                    giver = self._find_member_by_name(str(giver_name), member_lookup) if giver_name else None
-                    receiver = self._find_member_by_name(str(receiver_name), member_lookup) if receiver_name else None
+                    # Normalize names and find members (cell values are usually already str)
+                    if giver_name and not isinstance(giver_name, str):
+                        giver_name = str(giver_name)
+                    if receiver_name and not isinstance(receiver_name, str):
+                        receiver_name = str(receiver_name)
+                    giver = self._find_member_by_name(giver_name, member_lookup) if giver_name else None
+                    receiver = self._find_member_by_name(receiver_name, member_lookup) if receiver_name else None
                     
                     # For TYFCB: only receiver is required
                     # For others: both giver and receiver are required
-                    if normalized_slip_type == SlipType.TYFCB.value:
+                    if is_tyfcb:
                         if not receiver:
                             continue  # Skip TYFCB if we can't find the receiver
                     else:
@@ -93,45 +183,7 @@ class PalmsRepository:
                             continue  # Skip if we can't find both members
                     
                     # Process based on slip type
-                    if normalized_slip_type == SlipType.REFERRAL.value:
-                        referral = Referral(giver=giver, receiver=receiver)
-                        referrals.append(referral)
-                        
-                    elif normalized_slip_type == SlipType.ONE_TO_ONE.value:
-                        one_to_one = OneToOne(member1=giver, member2=receiver)
-                        one_to_ones.append(one_to_one)
-                        
-                    elif normalized_slip_type == SlipType.TYFCB.value:
-                        # Extract TYFCB amount and detail
-                        tyfcb_amount = row[ExcelColumns.TYFCB_AMOUNT.value] if len(row) > ExcelColumns.TYFCB_AMOUNT.value else None
-                        detail = row[ExcelColumns.DETAIL.value] if len(row) > ExcelColumns.DETAIL.value else None
-                        
-                        # Parse amount - handle currency formatting
-                        try:
-                            if tyfcb_amount is not None:
-                                # Remove common currency formatting
-                                amount_str = str(tyfcb_amount).replace('$', '').replace(',', '').strip()
-                                amount = float(amount_str) if amount_str else 0.0
-                            else:
-                                amount = 0.0
-                        except (ValueError, TypeError):
-                            amount = 0.0
-                        
-                        # Determine if within chapter (empty detail field means within chapter)
-                        within_chapter = detail is None or str(detail).strip() == ""
-                        
-                        # Create TYFCB entry (focused on receiver, giver is optional)
-                        if amount > 0:  # Only add TYFCB entries with valid amounts
-                            tyfcb = TYFCB(
-                                receiver=receiver,  # Primary focus: who received the business
-                                amount=amount,
-                                within_chapter=within_chapter,
-                                giver=giver,  # Optional: may be None for TYFCB entries
-                                description=str(detail) if detail else None
-                            )
-                            tyfcbs.append(tyfcb)
-                    
-                    # Unrecognized slip types are silently ignored
+                    handle_slip(giver, receiver, row, tyfcb_amount)
                 
                 except Exception as e:
                     # Continue processing other rows if there's an error
@@ -141,6 +193,55 @@ class PalmsRepository:
             
         except Exception as e:
             raise DataProcessingError(f"Error extracting PALMS data from {file_path}: {str(e)}")
+        
+        finally:
+            # Read-only workbooks keep the file open until closed
+            if workbook is not None:
+                workbook.close()
+    
+    def _parse_tyfcb_amount(self, tyfcb_amount) -> float:
+        """
+        Parse a TYFCB amount cell, handling currency formatting.
+        
+        Args:
+            tyfcb_amount: Raw amount cell value
+            
+        Returns:
+            Parsed amount, or 0.0 if the cell is empty or not a number
+        """
+        try:
+            if tyfcb_amount is not None:
+                # Remove common currency formatting
+                amount_str = str(tyfcb_amount).replace('$', '').replace(',', '').strip()
+                return float(amount_str) if amount_str else 0.0
+            return 0.0
+        except (ValueError, TypeError):
+            return 0.0
+    
+    def _append_tyfcb(self, tyfcbs: List[TYFCB], giver: Optional[Member], receiver: Member,
+                      amount: float, detail) -> None:
+        """
+        Record a TYFCB entry from a row whose amount has already been validated.
+        
+        Args:
+            tyfcbs: List to append the TYFCB entry to
+            giver: Optional member who gave the business
+            receiver: Member who received the business
+            amount: Parsed, positive amount
+            detail: Raw detail cell value
+        """
+        # Determine if within chapter (empty detail field means within chapter)
+        within_chapter = detail is None or str(detail).strip() == ""
+        
+        # Create TYFCB entry (focused on receiver, giver is optional)
+        tyfcb = TYFCB(
+            receiver=receiver,  # Primary focus: who received the business
+            amount=amount,
+            within_chapter=within_chapter,
+            giver=giver,  # Optional: may be None for TYFCB entries
+            description=str(detail) if detail else None
+        )
+        tyfcbs.append(tyfcb)
     
     def load_all_palms_data(self, members: List[Member]) -> Tuple[List[Referral], List[OneToOne], List[TYFCB]]:
         """
@@ -153,9 +254,10 @@ class PalmsRepository:
             Tuple of (all_referrals, all_one_to_ones, all_tyfcbs)
         """
         try:
-            all_referrals = []
-            all_one_to_ones = []
-            all_tyfcbs = []
+            # Collect per-file results and concatenate once at the end
+            per_file_referrals = []
+            per_file_one_to_ones = []
+            per_file_tyfcbs = []
             
             excel_files = self.path_manager.get_excel_files()
             
@@ -165,14 +267,18 @@ class PalmsRepository:
             for file_path in excel_files:
                 try:
                     referrals, one_to_ones, tyfcbs = self.extract_palms_data_from_file(file_path, members)
-                    all_referrals.extend(referrals)
-                    all_one_to_ones.extend(one_to_ones)
-                    all_tyfcbs.extend(tyfcbs)
+                    per_file_referrals.append(referrals)
+                    per_file_one_to_ones.append(one_to_ones)
+                    per_file_tyfcbs.append(tyfcbs)
                     
                 except DataProcessingError:
                     # Skip files that can't be processed
                     continue
             
+            all_referrals = list(chain.from_iterable(per_file_referrals))
+            all_one_to_ones = list(chain.from_iterable(per_file_one_to_ones))
+            all_tyfcbs = list(chain.from_iterable(per_file_tyfcbs))
+            
             return all_referrals, all_one_to_ones, all_tyfcbs
             
         except Exception as e:
@@ -180,6 +286,45 @@ class PalmsRepository:
                 raise
             raise DataProcessingError(f"Error loading all PALMS data: {str(e)}")
     
+    def _read_csv_rows(self, file_path: Path, limit: Optional[int] = None) -> List[List[str]]:
+        """
+        Read rows from a PALMS CSV export.
+        
+        The file is decoded as UTF-8 (stripping any byte-order mark) and, if
+        that fails, re-read as Windows-1252, which Excel uses when saving CSV
+        files on Windows.
+        
+        Args:
+            file_path: Path to the CSV file
+            limit: Maximum number of rows to read, or None to read every row
+        
+        Returns:
+            List of rows, each a list of cell strings
+        """
+        if not file_path.exists():
+            raise DataProcessingError(f"File not found: {file_path}")
+        
+        for encoding in self._csv_encodings():
+            try:
+                with open(file_path, 'r', encoding=encoding, newline='') as f:
+                    return list(islice(csv.reader(f), limit))
+            except UnicodeDecodeError:
+                continue
+        
+        raise DataProcessingError(
+            f"Could not read {file_path.name}: CSV files must be saved as UTF-8 "
+            f"or Windows-1252 text"
+        )
+    
+    def _csv_encodings(self) -> Tuple[str, ...]:
+        """Return the encodings to try, in order, when decoding a CSV file."""
+        encoding = self.excel_handler.settings.excel.encoding
+        if codecs.lookup(encoding).name == 'utf-8':
+            encoding = 'utf-8-sig'
+        if codecs.lookup(encoding).name == codecs.lookup(CSV_FALLBACK_ENCODING).name:
+            return (encoding,)
+        return (encoding, CSV_FALLBACK_ENCODING)
+
     def _normalize_slip_type(self, slip_type: str) -> Optional[str]:
         """
         Normalize slip type for robust matching.
@@ -193,41 +338,7 @@ class PalmsRepository:
         if not slip_type or not isinstance(slip_type, str):
             return None
         
-        # Normalize: strip whitespace and convert to standard case
-        normalized = slip_type.strip()
-        
-        # Check for exact matches first
-        if normalized == SlipType.REFERRAL.value:
-            return SlipType.REFERRAL.value
-        elif normalized == SlipType.ONE_TO_ONE.value:
-            return SlipType.ONE_TO_ONE.value
-        elif normalized == SlipType.TYFCB.value:
-            return SlipType.TYFCB.value
-        
-        # Check for case-insensitive matches
-        normalized_upper = normalized.upper()
-        if normalized_upper == SlipType.REFERRAL.value.upper():
-            return SlipType.REFERRAL.value
-        elif normalized_upper == SlipType.ONE_TO_ONE.value.upper():
-            return SlipType.ONE_TO_ONE.value
-        elif normalized_upper == SlipType.TYFCB.value.upper():
-            return SlipType.TYFCB.value
-        
-        # Check for common variations
-        # TYFCB variations
-        if normalized_upper in ['TYFCB', 'TY FCB', 'TY-FCB', 'THANK YOU FCB', 'THANK YOU FOR CLOSE BUSINESS']:
-            return SlipType.TYFCB.value
-        
-        # One-to-One variations
-        if normalized_upper in ['ONE TO ONE', 'ONE-TO-ONE', '1-TO-1', '1 TO 1', 'OTO', 'ONE2ONE']:
-            return SlipType.ONE_TO_ONE.value
-        
-        # Referral variations
-        if normalized_upper in ['REFERRAL', 'REF', 'REFERRALS']:
-            return SlipType.REFERRAL.value
-        
-        # Return None for unrecognized slip types
-        return None
+        return _normalize_slip_type_text(slip_type)
     
     def _find_member_by_name(self, name: str, member_lookup: dict) -> Optional[Member]:
         """
@@ -244,8 +355,11 @@ class PalmsRepository:
             if not name:
                 return None
             
-            # Normalize the name
-            normalized_name = name.replace(" ", "").lower()
+            # Fast path: names that are already normalized need no new strings
+            if name.isascii() and name.islower() and " " not in name:
+                normalized_name = name
+            else:
+                normalized_name = name.replace(" ", "").lower()
             
             # Direct lookup
             return member_lookup.get(normalized_name)
@@ -268,27 +382,36 @@ class PalmsRepository:
             Dictionary with statistics
         """
         try:
-            # Get unique members involved
-            referral_members = set()
+            # Collect member and pair sets in a single pass over each list
+            referral_givers = set()
+            referral_receivers = set()
+            referral_pairs = set()
             for referral in referrals:
-                referral_members.add(referral.giver)
-                referral_members.add(referral.receiver)
+                giver, receiver = referral.giver, referral.receiver
+                referral_givers.add(giver)
+                referral_receivers.add(receiver)
+                referral_pairs.add((giver, receiver))
+            referral_members = referral_givers | referral_receivers
+            all_members = set(referral_members)
             
             oto_members = set()
+            oto_pairs = set()
             for oto in one_to_ones:
                 oto_members.add(oto.member1)
                 oto_members.add(oto.member2)
+                oto_pairs.add((oto.member1, oto.member2))
+            all_members.update(oto_members)
             
             return {
                 'total_referrals': len(referrals),
                 'total_one_to_ones': len(one_to_ones),
                 'unique_referral_members': len(referral_members),
                 'unique_oto_members': len(oto_members),
-                'all_active_members': len(referral_members.union(oto_members)),
-                'referral_givers': len(set(r.giver for r in referrals)),
-                'referral_receivers': len(set(r.receiver for r in referrals)),
-                'unique_referral_pairs': len(set((r.giver, r.receiver) for r in referrals)),
-                'unique_oto_pairs': len(set((oto.member1, oto.member2) for oto in one_to_ones))
+                'all_active_members': len(all_members),
+                'referral_givers': len(referral_givers),
+                'referral_receivers': len(referral_receivers),
+                'unique_referral_pairs': len(referral_pairs),
+                'unique_oto_pairs': len(oto_pairs)
             }
             
         except Exception as e:
@@ -344,6 +467,9 @@ class PalmsRepository:
             True if the file appears to be in PALMS format
         """
         try:
+            if file_path.suffix.lower() == '.csv':
+                return self._validate_csv_format(file_path)
+            
             # First check if it's a valid Excel file
             if not self.excel_handler.validate_excel_file(file_path):
                 return False
@@ -369,5 +495,18 @@ class PalmsRepository:
             except Exception:
                 return False
             
+        except Exception:
+            return False
+    
+    def _validate_csv_format(self, file_path: Path) -> bool:
+        """Validate that a CSV file has at least two columns of PALMS data."""
+        try:
+            rows = self._read_csv_rows(file_path, limit=10)
+            if not rows or max(len(row) for row in rows) < 2:
+                return False
+            
+            # PALMS files should have some data in the first few rows
+            return any(any(cell.strip() for cell in row) for row in rows)
+            
         except Exception:
             return False
\ No newline at end of file
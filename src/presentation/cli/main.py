@@ -7,10 +7,8 @@ from pathlib import Path
 # Add src to path to allow imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from src.application.use_cases.generate_reports import GenerateReportsUseCase
-from src.application.use_cases.process_palms_data import ProcessPalmsDataUseCase
-from src.application.use_cases.compare_matrices import CompareMatricesUseCase
-from src.application.dto.report_request import ReportGenerationRequest, ProcessPalmsDataRequest, MatrixComparisonRequest
+# Use cases pull in pandas/openpyxl, so they are imported inside the command
+# handlers that need them to keep `--help` and `clean` fast.
 from src.infrastructure.config.settings import configure_app, get_settings
 from src.infrastructure.config.paths import get_path_manager
 
@@ -110,6 +108,9 @@ Examples:
 
 def handle_generate_command(args):
     """Handle the generate reports command."""
+    from src.application.use_cases.generate_reports import GenerateReportsUseCase
+    from src.application.dto.report_request import ReportGenerationRequest
+    
     print("📊 Generating analysis reports...")
     
     path_manager = get_path_manager()
@@ -165,6 +166,9 @@ def handle_generate_command(args):
 
 def handle_process_command(args):
     """Handle the process data command."""
+    from src.application.use_cases.process_palms_data import ProcessPalmsDataUseCase
+    from src.application.dto.report_request import ProcessPalmsDataRequest
+    
     print("🔄 Processing PALMS data...")
     
     path_manager = get_path_manager()
@@ -213,6 +217,9 @@ def handle_process_command(args):
 
 def handle_compare_command(args):
     """Handle the compare matrices command."""
+    from src.application.use_cases.compare_matrices import CompareMatricesUseCase
+    from src.application.dto.report_request import MatrixComparisonRequest
+    
     print("🔄 Comparing matrices...")
     
     use_case = CompareMatricesUseCase()
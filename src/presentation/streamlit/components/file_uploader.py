@@ -1,15 +1,23 @@
 """Reusable file uploader component for Streamlit."""
 
+import shutil
 import streamlit as st
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Callable, Dict, Any
+from typing import List, Optional, Callable, Dict, Any, Tuple
 
 from src.shared.constants.app_constants import StreamlitConfig
 
+# Chunk size used when streaming uploaded files to disk
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
 
 class FileUploaderComponent:
     """Reusable file uploader component with validation and processing."""
     
+    # Save directories already created during this process
+    _dirs_created: set = set()
+    
     def __init__(self, 
                  component_id: str,
                  title: str,
@@ -34,24 +42,24 @@ class FileUploaderComponent:
         self.accept_multiple = accept_multiple
         self.max_size_mb = max_size_mb
         self.allowed_types = allowed_types or StreamlitConfig.ALLOWED_TYPES
+        self._allowed_types_lower = frozenset(ext.lower() for ext in self.allowed_types)
+        self._allowed_types_tuple = tuple(self.allowed_types)
+        
+        # Session state keys for this component
+        self._uploader_key = f"uploader_{component_id}"
+        self._files_key = f"files_{component_id}"
+        self._errors_key = f"errors_{component_id}"
+        self._signature_key = f"signature_{component_id}"
         
         # Initialize session state keys
         self._init_session_state()
     
     def _init_session_state(self) -> None:
         """Initialize session state variables for this component."""
-        uploader_key = f"uploader_{self.component_id}"
-        files_key = f"files_{self.component_id}"
-        errors_key = f"errors_{self.component_id}"
-        
-        if uploader_key not in st.session_state:
-            st.session_state[uploader_key] = 0
-        
-        if files_key not in st.session_state:
-            st.session_state[files_key] = []
-        
-        if errors_key not in st.session_state:
-            st.session_state[errors_key] = []
+        session_state = st.session_state
+        session_state.setdefault(self._uploader_key, 0)
+        session_state.setdefault(self._files_key, [])
+        session_state.setdefault(self._errors_key, [])
     
     def render(self, save_directory: Path) -> Dict[str, Any]:
         """
@@ -69,15 +77,23 @@ class FileUploaderComponent:
             'success': False
         }
         
-        # Create save directory if it doesn't exist
-        save_directory.mkdir(parents=True, exist_ok=True)
+        # Create save directory once per process rather than on every rerun
+        directory_key = str(save_directory)
+        if directory_key not in FileUploaderComponent._dirs_created:
+            save_directory.mkdir(parents=True, exist_ok=True)
+            FileUploaderComponent._dirs_created.add(directory_key)
+        
+        # Instances may be shared across sessions by the cached factories below,
+        # so make sure this session has its keys before reading them
+        self._init_session_state()
+        session_state = st.session_state
         
         # Display file uploader
-        uploader_key = f"uploader_{self.component_id}_{st.session_state[f'uploader_{self.component_id}']}"
+        uploader_key = f"{self._uploader_key}_{session_state[self._uploader_key]}"
         
         uploaded_files = st.file_uploader(
             self.title,
-            type=self.allowed_types,
+            type=self._allowed_types_tuple,
             accept_multiple_files=self.accept_multiple,
             help=self.help_text,
             key=uploader_key
@@ -88,31 +104,33 @@ class FileUploaderComponent:
             if not self.accept_multiple:
                 uploaded_files = [uploaded_files]
             
+            # Skip re-validating and re-writing files that were already persisted
+            # for this exact widget value and are still on disk. file_id is unique
+            # per upload, so re-uploading a changed file with the same name and
+            # size is still written
+            signature = tuple(f.file_id for f in uploaded_files)
+            if self._is_persisted(signature):
+                result['files'] = list(session_state[self._files_key])
+                result['errors'] = list(session_state[self._errors_key])
+                result['success'] = len(result['files']) > 0 and len(result['errors']) == 0
+                self._display_results(result)
+                return result
+            
+            # Save files one at a time so uploads sharing a name overwrite each
+            # other in order instead of writing to the same path concurrently
             for uploaded_file in uploaded_files:
-                try:
-                    # Validate file
-                    validation_result = self._validate_file(uploaded_file)
-                    if not validation_result['valid']:
-                        result['errors'].extend(validation_result['errors'])
-                        continue
-                    
-                    # Save file
-                    file_path = save_directory / uploaded_file.name
-                    with open(file_path, "wb") as f:
-                        f.write(uploaded_file.getbuffer())
-                    
+                file_path, errors = self._process_one(uploaded_file, save_directory)
+                if file_path is not None:
                     result['files'].append(file_path)
-                    
-                except Exception as e:
-                    error_msg = f"Error processing {uploaded_file.name}: {str(e)}"
-                    result['errors'].append(error_msg)
+                result['errors'].extend(errors)
+            
+            session_state[self._signature_key] = signature
+        else:
+            session_state.pop(self._signature_key, None)
         
         # Update session state
-        files_key = f"files_{self.component_id}"
-        errors_key = f"errors_{self.component_id}"
-        
-        st.session_state[files_key] = result['files']
-        st.session_state[errors_key] = result['errors']
+        session_state[self._files_key] = result['files']
+        session_state[self._errors_key] = result['errors']
         
         result['success'] = len(result['files']) > 0 and len(result['errors']) == 0
         
@@ -121,6 +139,49 @@ class FileUploaderComponent:
         
         return result
     
+    def _is_persisted(self, signature: Tuple[str, ...]) -> bool:
+        """
+        Check whether the given upload signature was already saved to disk.
+        
+        Args:
+            signature: Tuple of file IDs for the uploaded files
+            
+        Returns:
+            True if the files for this signature are saved and still exist
+        """
+        session_state = st.session_state
+        if session_state.get(self._signature_key) != signature:
+            return False
+        return all(file_path.exists() for file_path in session_state[self._files_key])
+    
+    def _process_one(self, uploaded_file, save_directory: Path) -> Tuple[Optional[Path], List[str]]:
+        """
+        Validate and save a single uploaded file.
+        
+        Args:
+            uploaded_file: Streamlit uploaded file object
+            save_directory: Directory where the file should be saved
+            
+        Returns:
+            Tuple of (saved file path or None, list of errors)
+        """
+        try:
+            # Validate file
+            validation_result = self._validate_file(uploaded_file)
+            if not validation_result['valid']:
+                return None, validation_result['errors']
+            
+            # Save file in fixed-size chunks instead of one large write
+            file_path = save_directory / uploaded_file.name
+            uploaded_file.seek(0)
+            with open(file_path, "wb") as f:
+                shutil.copyfileobj(uploaded_file, f, length=UPLOAD_CHUNK_SIZE)
+            
+            return file_path, []
+            
+        except Exception as e:
+            return None, [f"Error processing {uploaded_file.name}: {str(e)}"]
+    
     def _validate_file(self, uploaded_file) -> Dict[str, Any]:
         """
         Validate an uploaded file.
@@ -137,28 +198,40 @@ class FileUploaderComponent:
         }
         
         try:
-            # Check file size
-            file_size_mb = len(uploaded_file.getbuffer()) / (1024 * 1024)
-            if file_size_mb > self.max_size_mb:
-                result['valid'] = False
-                result['errors'].append(
-                    f"File {uploaded_file.name} is too large ({file_size_mb:.1f}MB). "
-                    f"Maximum size is {self.max_size_mb}MB."
-                )
+            # Checks run cheapest first and stop at the first failure, so invalid
+            # uploads are rejected without touching the file contents
             
             # Check file extension
             file_extension = Path(uploaded_file.name).suffix.lower()[1:]  # Remove the dot
-            if file_extension not in [ext.lower() for ext in self.allowed_types]:
+            if file_extension not in self._allowed_types_lower:
                 result['valid'] = False
                 result['errors'].append(
                     f"File {uploaded_file.name} has unsupported format. "
                     f"Allowed formats: {', '.join(self.allowed_types)}"
                 )
+                return result
+            
+            # UploadedFile reports its size directly without materializing a buffer
+            file_size = uploaded_file.size
             
             # Check for empty file
-            if len(uploaded_file.getbuffer()) == 0:
+            if file_size == 0:
                 result['valid'] = False
                 result['errors'].append(f"File {uploaded_file.name} is empty.")
+                return result
+            
+            # Check file size
+            file_size_mb = file_size / (1024 * 1024)
+            if file_size_mb > self.max_size_mb:
+                result['valid'] = False
+                result['errors'].append(
+                    f"File {uploaded_file.name} is too large ({file_size_mb:.1f}MB). "
+                    f"Maximum size is {self.max_size_mb}MB."
+                )
+                return result
+            
+            # The buffer position persists across reruns, so rewind before saving
+            uploaded_file.seek(0)
                 
         except Exception as e:
             result['valid'] = False
@@ -171,13 +244,11 @@ class FileUploaderComponent:
         if result['files']:
             st.success(f"✅ Successfully uploaded {len(result['files'])} file(s)")
             with st.expander("View uploaded files"):
-                for file_path in result['files']:
-                    st.write(f"📄 {file_path.name}")
+                st.markdown("\n".join(f"- 📄 {file_path.name}" for file_path in result['files']))
         
         if result['errors']:
             st.error(f"❌ {len(result['errors'])} error(s) occurred:")
-            for error in result['errors']:
-                st.error(error)
+            st.error("\n".join(f"- {error}" for error in result['errors']))
     
     def clear_files(self, save_directory: Path) -> None:
         """
@@ -187,20 +258,17 @@ class FileUploaderComponent:
             save_directory: Directory containing files to clear
         """
         try:
-            # Clear files from directory
+            # Clear files by removing and recreating the directory in one pass
             if save_directory.exists():
-                for file_path in save_directory.glob("*"):
-                    if file_path.is_file():
-                        file_path.unlink()
+                shutil.rmtree(save_directory, ignore_errors=True)
+                save_directory.mkdir(parents=True, exist_ok=True)
             
             # Reset session state
-            files_key = f"files_{self.component_id}"
-            errors_key = f"errors_{self.component_id}"
-            uploader_key = f"uploader_{self.component_id}"
-            
-            st.session_state[files_key] = []
-            st.session_state[errors_key] = []
-            st.session_state[uploader_key] += 1  # Force re-render of uploader
+            session_state = st.session_state
+            session_state[self._files_key] = []
+            session_state[self._errors_key] = []
+            session_state.pop(self._signature_key, None)
+            session_state[self._uploader_key] = session_state.get(self._uploader_key, 0) + 1  # Force re-render of uploader
             
             st.success("Files cleared successfully!")
             
@@ -209,13 +277,11 @@ class FileUploaderComponent:
     
     def get_uploaded_files(self) -> List[Path]:
         """Get list of currently uploaded files."""
-        files_key = f"files_{self.component_id}"
-        return st.session_state.get(files_key, [])
+        return st.session_state.get(self._files_key, [])
     
     def get_errors(self) -> List[str]:
         """Get list of current errors."""
-        errors_key = f"errors_{self.component_id}"
-        return st.session_state.get(errors_key, [])
+        return st.session_state.get(self._errors_key, [])
     
     def has_files(self) -> bool:
         """Check if any files have been uploaded."""
@@ -226,18 +292,20 @@ class FileUploaderComponent:
         return len(self.get_errors()) > 0
 
 
+@lru_cache(maxsize=8)
 def create_palms_uploader(component_id: str = "palms_data") -> FileUploaderComponent:
     """Create a file uploader specifically for PALMS data files."""
     return FileUploaderComponent(
         component_id=component_id,
         title="Choose Excel slip-audit-reports",
-        help_text="Upload your BNI PALMS slip audit reports in .xls or .xlsx format",
+        help_text="Upload your BNI PALMS slip audit reports in .xls, .xlsx or .csv format",
         accept_multiple=True,
         max_size_mb=50,
-        allowed_types=["xls", "xlsx"]
+        allowed_types=["xls", "xlsx", "csv"]
     )
 
 
+@lru_cache(maxsize=8)
 def create_members_uploader(component_id: str = "members_data") -> FileUploaderComponent:
     """Create a file uploader specifically for member data files."""
     return FileUploaderComponent(
@@ -1,7 +1,8 @@
 """Matrix comparison page for comparing performance over time."""
 
 import streamlit as st
-from typing import Optional
+from pathlib import Path
+from typing import Optional, Tuple
 
 from src.application.use_cases.compare_matrices import CompareMatricesUseCase
 from src.application.dto.report_request import MatrixComparisonRequest
@@ -14,13 +15,17 @@ from src.infrastructure.config.paths import get_path_manager
 from src.infrastructure.config.settings import configure_app
 
 
+@st.cache_resource
+def _get_compare_matrices_use_case() -> CompareMatricesUseCase:
+    """Configure the application and build the use case once per process."""
+    configure_app()
+    return CompareMatricesUseCase()
+
+
 def render_comparison_page():
     """Render the matrix comparison page."""
-    # Initialize application
-    configure_app()
-    
-    # Initialize use case
-    compare_matrices_use_case = CompareMatricesUseCase()
+    # Initialize application and use case (cached across reruns)
+    compare_matrices_use_case = _get_compare_matrices_use_case()
     path_manager = get_path_manager()
     
     st.title("🔄 Combination Matrix Comparison")
@@ -41,7 +46,7 @@ def render_comparison_page():
     
     # Progress tracker
     steps = ["Upload Matrices", "Validate Files", "Compare Data", "Generate Insights", "Download Results"]
-    current_step = _determine_current_step()
+    current_step = _determine_current_step(path_manager)
     create_progress_tracker(steps, current_step)
     
     # File upload section
@@ -157,27 +162,41 @@ def render_comparison_page():
     with col1:
         if st.button("Clear New Matrix", help="Remove uploaded new matrix file"):
             new_matrix_uploader.clear_files(path_manager.new_matrix_dir)
+            _list_matrix_files.clear()
             st.rerun()
     
     with col2:
         if st.button("Clear Old Matrix", help="Remove uploaded old matrix file"):
             old_matrix_uploader.clear_files(path_manager.old_matrix_dir)
+            _list_matrix_files.clear()
             st.rerun()
     
     with col3:
         if st.button("Clear All Files", help="Remove all uploaded matrix files"):
             new_matrix_uploader.clear_files(path_manager.new_matrix_dir)
             old_matrix_uploader.clear_files(path_manager.old_matrix_dir)
+            _list_matrix_files.clear()
             st.success("All matrix files cleared!")
             st.rerun()
 
 
-def _determine_current_step() -> int:
-    """Determine the current step in the comparison process."""
-    path_manager = get_path_manager()
+@st.cache_data(ttl=2, show_spinner=False)
+def _list_matrix_files(directory: str) -> Tuple[str, ...]:
+    """List matrix files in a directory, cached briefly across reruns."""
+    directory_path = Path(directory)
+    if not directory_path.exists():
+        return ()
     
-    new_files = path_manager.get_new_matrix_files()
-    old_files = path_manager.get_old_matrix_files()
+    extensions = get_path_manager().settings.excel.supported_extensions
+    return tuple(sorted(
+        str(file_path) for ext in extensions for file_path in directory_path.glob(f"*{ext}")
+    ))
+
+
+def _determine_current_step(path_manager) -> int:
+    """Determine the current step in the comparison process."""
+    new_files = _list_matrix_files(str(path_manager.new_matrix_dir))
+    old_files = _list_matrix_files(str(path_manager.old_matrix_dir))
     
     if not new_files or not old_files:
         return 0  # Upload Matrices
@@ -185,70 +204,76 @@ def _determine_current_step() -> int:
     return 1  # Validate Files
 
 
+def _validate_matrix_file(file_path) -> list:
+    """Validate a single matrix file, returning any errors."""
+    try:
+        if not file_path.exists():
+            return [f"File not found: {file_path}"]
+        
+        if file_path.suffix.lower() not in ['.xls', '.xlsx']:
+            return [f"Unsupported file format: {file_path}"]
+        
+        # Basic file validation
+        if file_path.stat().st_size == 0:
+            return [f"File is empty: {file_path}"]
+        
+        return []
+        
+    except Exception as e:
+        return [f"Error validating {file_path}: {str(e)}"]
+
+
 def _validate_matrix_files(files: list) -> list:
     """Validate matrix files for comparison."""
-    errors = []
-    
-    for file_path in files:
+    return [error for file_path in files for error in _validate_matrix_file(file_path)]
+
+
+@st.cache_data(show_spinner=False, ttl=24 * 60 * 60, max_entries=8)
+def _cached_load_matrix(file_path: str, mtime: float, _compare_use_case):
+    """Load a matrix file once per (path, mtime) and reuse it across reruns."""
+    return _compare_use_case.comparison_service.load_matrix_from_excel(Path(file_path))
+
+
+def _load_matrix_for_preview(file_path: Path, compare_use_case):
+    """Load a matrix for preview, keyed on modification time so edits invalidate the cache."""
+    return _cached_load_matrix(str(file_path), file_path.stat().st_mtime, compare_use_case)
+
+
+def _display_matrix_preview(new_file, old_file, compare_use_case):
+    """Display a preview of the matrix files inside a collapsed expander."""
+    with st.expander("📋 Matrix File Preview", expanded=False):
         try:
-            if not file_path.exists():
-                errors.append(f"File not found: {file_path}")
-                continue
+            new_df, new_headers = _load_matrix_for_preview(new_file, compare_use_case)
+            old_df, old_headers = _load_matrix_for_preview(old_file, compare_use_case)
             
-            if file_path.suffix.lower() not in ['.xls', '.xlsx']:
-                errors.append(f"Unsupported file format: {file_path}")
-                continue
+            col1, col2 = st.columns(2)
+            with col1:
+                st.markdown(_format_matrix_info("New Matrix Info", new_file, new_df, new_headers))
+            with col2:
+                st.markdown(_format_matrix_info("Old Matrix Info", old_file, old_df, old_headers))
             
-            # Basic file validation
-            if file_path.stat().st_size == 0:
-                errors.append(f"File is empty: {file_path}")
-                continue
+            # Compatibility check
+            if new_headers and old_headers:
+                st.success("✅ Both matrices have compatible formats for comparison!")
+            else:
+                st.warning("⚠️ Matrix files may not have the expected format. Comparison may fail.")
                 
         except Exception as e:
-            errors.append(f"Error validating {file_path}: {str(e)}")
-    
-    return errors
+            st.error(f"Error previewing matrix files: {str(e)}")
 
 
-def _display_matrix_preview(new_file, old_file, compare_use_case):
-    """Display a preview of the matrix files."""
-    st.subheader("📋 Matrix File Preview")
-    
-    try:
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.write("**New Matrix Info:**")
-            new_df, new_headers = compare_use_case.comparison_service.load_matrix_from_excel(new_file)
-            st.write(f"• File: {new_file.name}")
-            st.write(f"• Size: {new_df.shape[0]} rows × {new_df.shape[1]} columns")
-            st.write(f"• Headers found: {'✅' if new_headers else '❌'}")
-            
-            if new_headers:
-                st.write("• Required headers detected:")
-                for header in new_headers.keys():
-                    st.write(f"  - {header}")
-        
-        with col2:
-            st.write("**Old Matrix Info:**")
-            old_df, old_headers = compare_use_case.comparison_service.load_matrix_from_excel(old_file)
-            st.write(f"• File: {old_file.name}")
-            st.write(f"• Size: {old_df.shape[0]} rows × {old_df.shape[1]} columns")
-            st.write(f"• Headers found: {'✅' if old_headers else '❌'}")
-            
-            if old_headers:
-                st.write("• Required headers detected:")
-                for header in old_headers.keys():
-                    st.write(f"  - {header}")
-        
-        # Compatibility check
-        if new_headers and old_headers:
-            st.success("✅ Both matrices have compatible formats for comparison!")
-        else:
-            st.warning("⚠️ Matrix files may not have the expected format. Comparison may fail.")
-            
-    except Exception as e:
-        st.error(f"Error previewing matrix files: {str(e)}")
+def _format_matrix_info(title: str, file_path, df, headers) -> str:
+    """Build the markdown summary for one matrix file."""
+    lines = [
+        f"**{title}:**",
+        f"- File: {file_path.name}",
+        f"- Size: {df.shape[0]} rows × {df.shape[1]} columns",
+        f"- Headers found: {'✅' if headers else '❌'}",
+    ]
+    if headers:
+        lines.append("- Required headers detected:")
+        lines.extend(f"    - {header}" for header in headers.keys())
+    return "\n".join(lines)
 
 
 def _perform_comparison(compare_use_case: CompareMatricesUseCase,
@@ -341,74 +366,74 @@ def _display_detailed_insights(response, include_recommendations: bool, compare_
         # Executive Summary
         if 'executive_summary' in insights_report:
             summary = insights_report['executive_summary']
-            st.subheader("📋 Executive Summary")
-            
-            col1, col2 = st.columns(2)
-            with col1:
-                st.metric("Members Analyzed", summary.get('total_members_analyzed', 0))
-                st.metric("Overall Performance", summary.get('overall_performance', 'Unknown'))
-            
-            with col2:
-                if 'key_metrics' in summary:
-                    metrics = summary['key_metrics']
-                    for metric, value in metrics.items():
-                        st.metric(metric.replace('_', ' ').title(), value)
+            with st.expander("📋 Executive Summary", expanded=True):
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.metric("Members Analyzed", summary.get('total_members_analyzed', 0))
+                    st.metric("Overall Performance", summary.get('overall_performance', 'Unknown'))
+                
+                with col2:
+                    if 'key_metrics' in summary:
+                        metrics = summary['key_metrics']
+                        for metric, value in metrics.items():
+                            st.metric(metric.replace('_', ' ').title(), value)
         
-        # Member Performance Analysis
+        # Member Performance Analysis - per-member lists stay collapsed until opened
         if 'member_performance' in insights_report:
             performance = insights_report['member_performance']
-            st.subheader("👥 Member Performance Analysis")
-            
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.write("**🌟 Top Performers**")
-                top_performers = performance.get('top_performers', [])
-                if top_performers:
-                    for performer in top_performers:
-                        st.success(f"**{performer['member']}**: +{performer['improvement']} ({performer['category']})")
-                else:
-                    st.write("No significant improvements detected.")
-            
-            with col2:
-                st.write("**⚠️ Needs Attention**")
-                needs_attention = performance.get('needs_attention', [])
-                if needs_attention:
-                    for member in needs_attention:
-                        st.error(f"**{member['member']}**: -{member['decline']} ({member['category']})")
-                else:
-                    st.write("No significant declines detected.")
+            with st.expander("👥 Member Performance Analysis", expanded=False):
+                col1, col2 = st.columns(2)
+                
+                with col1:
+                    st.write("**🌟 Top Performers**")
+                    top_performers = performance.get('top_performers', [])
+                    if top_performers:
+                        st.success("\n".join(
+                            f"- **{performer['member']}**: +{performer['improvement']} ({performer['category']})"
+                            for performer in top_performers
+                        ))
+                    else:
+                        st.write("No significant improvements detected.")
+                
+                with col2:
+                    st.write("**⚠️ Needs Attention**")
+                    needs_attention = performance.get('needs_attention', [])
+                    if needs_attention:
+                        st.error("\n".join(
+                            f"- **{member['member']}**: -{member['decline']} ({member['category']})"
+                            for member in needs_attention
+                        ))
+                    else:
+                        st.write("No significant declines detected.")
         
         # Trend Analysis
         if 'trend_analysis' in insights_report:
             trends = insights_report['trend_analysis']
-            st.subheader("📈 Trend Analysis")
-            
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.metric("Overall Direction", trends.get('overall_direction', 'Unknown'))
-                st.metric("Engagement Trend", trends.get('engagement_trend', 'Unknown'))
-            
-            with col2:
-                if 'metrics' in trends:
-                    trend_metrics = trends['metrics']
-                    for metric, value in trend_metrics.items():
-                        if isinstance(value, (int, float)):
-                            st.metric(metric.replace('_', ' ').title(), f"{value:.2f}")
-                        else:
-                            st.metric(metric.replace('_', ' ').title(), value)
+            with st.expander("📈 Trend Analysis", expanded=True):
+                col1, col2 = st.columns(2)
+                
+                with col1:
+                    st.metric("Overall Direction", trends.get('overall_direction', 'Unknown'))
+                    st.metric("Engagement Trend", trends.get('engagement_trend', 'Unknown'))
+                
+                with col2:
+                    if 'metrics' in trends:
+                        trend_metrics = trends['metrics']
+                        for metric, value in trend_metrics.items():
+                            if isinstance(value, (int, float)):
+                                st.metric(metric.replace('_', ' ').title(), f"{value:.2f}")
+                            else:
+                                st.metric(metric.replace('_', ' ').title(), value)
         
         # Recommendations
         if include_recommendations and 'recommendations' in insights_report:
             recommendations = insights_report['recommendations']
-            st.subheader("💡 Recommendations")
-            
-            if recommendations:
-                for i, recommendation in enumerate(recommendations, 1):
-                    st.info(f"**{i}.** {recommendation}")
-            else:
-                st.write("No specific recommendations generated.")
+            with st.expander("💡 Recommendations", expanded=True):
+                if recommendations:
+                    for i, recommendation in enumerate(recommendations, 1):
+                        st.info(f"**{i}.** {recommendation}")
+                else:
+                    st.write("No specific recommendations generated.")
                 
     except Exception as e:
         st.error(f"Error displaying detailed insights: {str(e)}")
\ No newline at end of file
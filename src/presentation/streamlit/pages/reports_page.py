@@ -1,7 +1,9 @@
 """Reports page for generating BNI analysis reports."""
 
+import os
 import streamlit as st
-from typing import Optional
+from pathlib import Path
+from typing import List, Optional, Tuple
 
 from src.application.use_cases.generate_reports import GenerateReportsUseCase
 from src.application.use_cases.process_palms_data import ProcessPalmsDataUseCase
@@ -10,40 +12,51 @@ from src.presentation.streamlit.components.file_uploader import create_palms_upl
 from src.presentation.streamlit.utils.streamlit_helpers import (
     display_report_generation_results, create_progress_tracker, 
     display_file_validation_results, create_data_quality_display,
-    safe_streamlit_operation
+    display_error_messages, display_warning_messages, safe_streamlit_operation
 )
 from src.infrastructure.config.paths import get_path_manager
 from src.infrastructure.config.settings import configure_app
 
+# Session state key holding (directory mtimes, step) for the progress tracker
+STEP_CACHE_KEY = "_step_cache"
+
+# Session state keys for the report option checkboxes
+OPTION_KEYS = {
+    'include_referral': "report_opt_include_referral",
+    'include_oto': "report_opt_include_oto",
+    'include_combination': "report_opt_include_combination",
+    'include_comprehensive': "report_opt_include_comprehensive",
+    'validate_data_quality': "report_opt_validate_data_quality",
+    'show_processing_details': "report_opt_show_processing_details"
+}
+
+
+@st.cache_resource
+def _configure_app_once() -> None:
+    """Configure the application once per process rather than on every rerun."""
+    configure_app()
+
+
+@st.cache_resource
+def _get_report_use_cases() -> Tuple[GenerateReportsUseCase, ProcessPalmsDataUseCase]:
+    """Build the report generation and data processing use cases once per process."""
+    _configure_app_once()
+    return GenerateReportsUseCase(), ProcessPalmsDataUseCase()
+
 
 def render_reports_page():
     """Render the main reports generation page."""
-    # Initialize application
-    configure_app()
-    
-    # Initialize use cases
-    generate_reports_use_case = GenerateReportsUseCase()
-    process_data_use_case = ProcessPalmsDataUseCase()
+    # Initialize application and use cases (cached across reruns)
+    generate_reports_use_case, process_data_use_case = _get_report_use_cases()
     path_manager = get_path_manager()
     
     st.title("📊 BNI PALMS Analysis")
     
     # Instructions
-    st.markdown("""
-    ### 📋 Instructions
-    
-    1. **Upload Excel slip-audit-reports** (multiple files supported)
-    2. **Upload member names file** (single Excel file with first and last names)
-    3. **Click "Generate Reports"** to create your analysis matrices
-    4. **Download the generated reports** when processing is complete
-    
-    **Note:** Files must be in .xls or .xlsx format
-    """)
+    _render_instructions()
     
     # Progress tracker
-    steps = ["Upload Files", "Validate Data", "Process Data", "Generate Reports", "Download Results"]
-    current_step = _determine_current_step()
-    create_progress_tracker(steps, current_step)
+    _render_progress_tracker(path_manager)
     
     # File upload section
     st.markdown("---")
@@ -59,7 +72,7 @@ def render_reports_page():
     with col2:
         st.subheader("Member Names File")
         members_uploader = create_members_uploader("members_list")
-        members_result = members_result = members_uploader.render(path_manager.member_names_dir)
+        members_result = members_uploader.render(path_manager.member_names_dir)
     
     # File validation
     if palms_uploader.has_files() and members_uploader.has_files():
@@ -67,11 +80,14 @@ def render_reports_page():
         st.header("✅ Step 2: Validate Files")
         
         # Validate files
-        all_files = palms_uploader.get_uploaded_files() + members_uploader.get_uploaded_files()
+        palms_files = palms_uploader.get_uploaded_files()
+        member_files = members_uploader.get_uploaded_files()
+        all_files = palms_files + member_files
         validation_errors = safe_streamlit_operation(
-            lambda: generate_reports_use_case.validate_input_files(
-                palms_uploader.get_uploaded_files(),
-                members_uploader.get_uploaded_files()
+            lambda: _cached_validate_input_files(
+                _file_fingerprint(palms_files),
+                _file_fingerprint(member_files),
+                generate_reports_use_case
             ),
             "File validation failed"
         )
@@ -83,21 +99,8 @@ def render_reports_page():
             st.markdown("---")
             st.header("⚙️ Step 3: Generate Reports")
             
-            # Report options
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.subheader("Report Options")
-                include_referral = st.checkbox("Generate Referral Matrix", value=True)
-                include_oto = st.checkbox("Generate One-to-One Matrix", value=True)
-                include_combination = st.checkbox("Generate Combination Matrix", value=True)
-                include_comprehensive = st.checkbox("Generate Comprehensive Member Report", value=False, 
-                                                  help="Generates a comprehensive report with all metrics per member (within chapter data only)")
-            
-            with col2:
-                st.subheader("Advanced Options")
-                validate_data_quality = st.checkbox("Validate Data Quality", value=True)
-                show_processing_details = st.checkbox("Show Processing Details", value=False)
+            # Report options (kept in session state by the options fragment)
+            _render_report_options()
             
             # Generate reports button
             if st.button("🚀 Generate Reports", type="primary", use_container_width=True):
@@ -105,15 +108,82 @@ def render_reports_page():
                     generate_reports_use_case,
                     process_data_use_case,
                     path_manager,
-                    include_referral,
-                    include_oto,
-                    include_combination,
-                    include_comprehensive,
-                    validate_data_quality,
-                    show_processing_details
+                    st.session_state[OPTION_KEYS['include_referral']],
+                    st.session_state[OPTION_KEYS['include_oto']],
+                    st.session_state[OPTION_KEYS['include_combination']],
+                    st.session_state[OPTION_KEYS['include_comprehensive']],
+                    st.session_state[OPTION_KEYS['validate_data_quality']],
+                    st.session_state[OPTION_KEYS['show_processing_details']]
                 )
     
     # Clear files section
+    _render_file_management(path_manager, palms_uploader, members_uploader)
+
+
+def _file_fingerprint(files: List[Path]) -> Tuple[Tuple[str, Optional[int], Optional[int]], ...]:
+    """Build a sorted (path, mtime_ns, size) tuple identifying a set of files."""
+    fingerprint = []
+    for file_path in files:
+        try:
+            stat = file_path.stat()
+            fingerprint.append((str(file_path), stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            fingerprint.append((str(file_path), None, None))
+    return tuple(sorted(fingerprint))
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _cached_validate_input_files(palms_fingerprint: tuple, members_fingerprint: tuple,
+                                 _generate_reports_use_case: GenerateReportsUseCase) -> List[str]:
+    """Validate input files, reusing the result while the files are unchanged."""
+    return _generate_reports_use_case.validate_input_files(
+        [Path(path) for path, _, _ in palms_fingerprint],
+        [Path(path) for path, _, _ in members_fingerprint]
+    )
+
+
+@st.fragment
+def _render_instructions():
+    """Render the static instructions block."""
+    st.markdown("""
+    ### 📋 Instructions
+    
+    1. **Upload slip-audit-reports** (multiple Excel or CSV files supported)
+    2. **Upload member names file** (single Excel file with first and last names)
+    3. **Click "Generate Reports"** to create your analysis matrices
+    4. **Download the generated reports** when processing is complete
+    
+    **Note:** Slip-audit-reports can be .xls, .xlsx or .csv; the member names file must be .xls or .xlsx
+    """)
+
+
+@st.fragment
+def _render_report_options():
+    """
+    Render the report option checkboxes.
+    
+    Toggling an option only reruns this fragment; the selected values are
+    read back from session state under OPTION_KEYS when reports are generated.
+    """
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("Report Options")
+        st.checkbox("Generate Referral Matrix", value=True, key=OPTION_KEYS['include_referral'])
+        st.checkbox("Generate One-to-One Matrix", value=True, key=OPTION_KEYS['include_oto'])
+        st.checkbox("Generate Combination Matrix", value=True, key=OPTION_KEYS['include_combination'])
+        st.checkbox("Generate Comprehensive Member Report", value=False, key=OPTION_KEYS['include_comprehensive'],
+                    help="Generates a comprehensive report with all metrics per member (within chapter data only)")
+    
+    with col2:
+        st.subheader("Advanced Options")
+        st.checkbox("Validate Data Quality", value=True, key=OPTION_KEYS['validate_data_quality'])
+        st.checkbox("Show Processing Details", value=False, key=OPTION_KEYS['show_processing_details'])
+
+
+@st.fragment
+def _render_file_management(path_manager, palms_uploader, members_uploader):
+    """Render the file management buttons."""
     st.markdown("---")
     st.header("🗑️ File Management")
     
@@ -122,32 +192,66 @@ def render_reports_page():
     with col1:
         if st.button("Clear PALMS Files", help="Remove all uploaded PALMS data files"):
             palms_uploader.clear_files(path_manager.excel_files_dir)
+            _invalidate_step_cache()
             st.rerun()
     
     with col2:
         if st.button("Clear Member Files", help="Remove all uploaded member files"):
             members_uploader.clear_files(path_manager.member_names_dir)
+            _invalidate_step_cache()
             st.rerun()
     
     with col3:
         if st.button("Clear All Files", help="Remove all uploaded files and generated reports"):
             _clear_all_files(path_manager, palms_uploader, members_uploader)
+            _invalidate_step_cache()
             st.rerun()
 
 
-def _determine_current_step() -> int:
+@st.fragment
+def _render_progress_tracker(path_manager):
+    """Render the progress tracker in its own fragment."""
+    steps = ["Upload Files", "Validate Data", "Process Data", "Generate Reports", "Download Results"]
+    current_step = _determine_current_step(path_manager)
+    create_progress_tracker(steps, current_step)
+
+
+def _directory_mtime(directory) -> Optional[int]:
+    """Get a directory's modification time, or None if it does not exist."""
+    try:
+        return os.stat(directory).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _determine_current_step(path_manager) -> int:
     """Determine the current step in the process."""
-    path_manager = get_path_manager()
+    # Only rescan the upload directories when their contents have changed
+    mtimes = (
+        _directory_mtime(path_manager.excel_files_dir),
+        _directory_mtime(path_manager.member_names_dir)
+    )
+    cached = st.session_state.get(STEP_CACHE_KEY)
+    if cached is not None and cached[0] == mtimes:
+        return cached[1]
     
     # Check if files are uploaded
     palms_files = path_manager.get_excel_files()
     member_files = path_manager.get_member_files()
     
     if not palms_files or not member_files:
-        return 0  # Upload Files
+        step = 0  # Upload Files
+    else:
+        # Files uploaded - assume at validation step
+        step = 1
     
-    # Files uploaded - assume at validation step
-    return 1
+    st.session_state[STEP_CACHE_KEY] = (mtimes, step)
+    return step
+
+
+def _invalidate_step_cache() -> None:
+    """Force the next progress tracker render to rescan the upload directories."""
+    st.session_state.pop(STEP_CACHE_KEY, None)
 
 
 def _generate_reports(generate_reports_use_case: GenerateReportsUseCase,
@@ -165,12 +269,22 @@ def _generate_reports(generate_reports_use_case: GenerateReportsUseCase,
     details_placeholder = st.empty()
     
     try:
-        # Step 1: Process data
-        with progress_placeholder.container():
-            st.info("🔄 Processing PALMS data...")
+        # Create report generation request
+        request = ReportGenerationRequest(
+            excel_files=path_manager.get_excel_files(),
+            member_files=path_manager.get_member_files(),
+            output_directory=path_manager.reports_dir,
+            include_referral_matrix=include_referral,
+            include_oto_matrix=include_oto,
+            include_combination_matrix=include_combination,
+            include_comprehensive_member_report=include_comprehensive
+        )
         
         if validate_data_quality:
-            # Process and validate data first
+            # Process, validate and generate reports from a single load of the data
+            with progress_placeholder.container():
+                st.info("🔄 Processing PALMS data and generating analysis reports...")
+            
             process_request = ProcessPalmsDataRequest(
                 data_directory=path_manager.excel_files_dir,
                 member_directory=path_manager.member_names_dir,
@@ -178,7 +292,9 @@ def _generate_reports(generate_reports_use_case: GenerateReportsUseCase,
                 validate_data=True
             )
             
-            process_response = process_data_use_case.execute(process_request)
+            process_response, response = generate_reports_use_case.execute_with_validation(
+                request, process_request, process_data_use_case
+            )
             
             if show_processing_details:
                 with details_placeholder.container():
@@ -198,38 +314,18 @@ def _generate_reports(generate_reports_use_case: GenerateReportsUseCase,
                     if process_response.data_quality_report:
                         create_data_quality_display(process_response.data_quality_report)
                     
-                    if process_response.warnings:
-                        st.warning("⚠️ **Data Quality Warnings:**")
-                        for warning in process_response.warnings:
-                            st.warning(f"• {warning}")
+                    display_warning_messages(process_response.warnings, "⚠️ Data Quality Warnings")
                     
                     if process_response.errors:
-                        st.error("❌ **Processing Errors:**")
-                        for error in process_response.errors:
-                            st.error(f"• {error}")
+                        progress_placeholder.empty()
+                        display_error_messages(process_response.errors, "❌ Processing Errors")
                         return
-        
-        # Step 2: Generate reports
-        with progress_placeholder.container():
-            st.info("📊 Generating analysis reports...")
-        
-        # Get file lists
-        excel_files = path_manager.get_excel_files()
-        member_files = path_manager.get_member_files()
-        
-        # Create report generation request
-        request = ReportGenerationRequest(
-            excel_files=excel_files,
-            member_files=member_files,
-            output_directory=path_manager.reports_dir,
-            include_referral_matrix=include_referral,
-            include_oto_matrix=include_oto,
-            include_combination_matrix=include_combination,
-            include_comprehensive_member_report=include_comprehensive
-        )
-        
-        # Generate reports
-        response = generate_reports_use_case.execute(request)
+        else:
+            # Generate reports
+            with progress_placeholder.container():
+                st.info("📊 Generating analysis reports...")
+            
+            response = generate_reports_use_case.execute(request)
         
         # Clear progress and show results
         progress_placeholder.empty()
@@ -268,5 +364,6 @@ def _cleanup_uploaded_files(path_manager):
     try:
         path_manager.cleanup_directory(path_manager.excel_files_dir)
         path_manager.cleanup_directory(path_manager.member_names_dir)
+        _invalidate_step_cache()
     except Exception as e:
         st.warning(f"Could not clean up uploaded files: {str(e)}")
\ No newline at end of file
@@ -1,8 +1,9 @@
 """Utility functions for Streamlit interface."""
 
 import streamlit as st
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import pandas as pd
 from io import BytesIO
 
@@ -13,25 +14,34 @@ from src.application.dto.analysis_response import ReportGenerationResponse, Matr
 def display_error_messages(errors: List[str], title: str = "Errors") -> None:
     """Display error messages in Streamlit."""
     if errors:
-        st.error(f"**{title}:**")
-        for error in errors:
-            st.error(f"• {error}")
+        body = "\n".join(f"- {error}" for error in errors)
+        st.error(f"**{title}:**\n{body}")
 
 
 def display_warning_messages(warnings: List[str], title: str = "Warnings") -> None:
     """Display warning messages in Streamlit."""
     if warnings:
-        st.warning(f"**{title}:**")
-        for warning in warnings:
-            st.warning(f"• {warning}")
+        body = "\n".join(f"- {warning}" for warning in warnings)
+        st.warning(f"**{title}:**\n{body}")
 
 
 def display_success_messages(messages: List[str], title: str = "Success") -> None:
     """Display success messages in Streamlit."""
     if messages:
-        st.success(f"**{title}:**")
-        for message in messages:
-            st.success(f"• {message}")
+        body = "\n".join(f"- {message}" for message in messages)
+        st.success(f"**{title}:**\n{body}")
+
+
+@st.cache_resource(show_spinner=False, max_entries=16)
+def _read_file_bytes(path_str: str, mtime_ns: int, size: int) -> bytes:
+    """
+    Read a file's bytes, cached per (path, mtime, size).
+    
+    The mtime and size arguments are only part of the cache key, so a file
+    rewritten in place is read again instead of served stale. Cached as a
+    resource so reruns share the same bytes object rather than a fresh copy.
+    """
+    return Path(path_str).read_bytes()
 
 
 def create_download_button(file_path: Path, label: str = None, 
@@ -44,13 +54,13 @@ def create_download_button(file_path: Path, label: str = None,
     label = label or f"Download {file_path.name}"
     
     try:
-        with open(file_path, "rb") as f:
-            st.download_button(
-                label=label,
-                data=f.read(),
-                file_name=file_path.name,
-                mime=mime_type
-            )
+        stat = file_path.stat()
+        st.download_button(
+            label=label,
+            data=_read_file_bytes(str(file_path), stat.st_mtime_ns, stat.st_size),
+            file_name=file_path.name,
+            mime=mime_type
+        )
     except Exception as e:
         st.error(f"Error creating download button: {str(e)}")
 
@@ -123,6 +133,24 @@ def display_matrix_comparison_results(response: MatrixComparisonResponse) -> Non
     display_error_messages(response.errors)
 
 
+# Row styles for member change tables
+_IMPROVEMENT_STYLE = "background-color: #d4edda"
+_DECLINE_STYLE = "background-color: #f8d7da"
+
+
+def _display_member_changes(changes: List[tuple], row_style: str) -> None:
+    """Display (member, change) pairs as a single styled table."""
+    if not changes:
+        return
+    
+    df = pd.DataFrame(changes, columns=["Member", "Change"])
+    st.dataframe(
+        df.style.apply(lambda row: [row_style] * len(row), axis=1),
+        use_container_width=True,
+        hide_index=True
+    )
+
+
 def display_comparison_insights(insights: Dict[str, Any]) -> None:
     """Display matrix comparison insights."""
     st.write("## 📈 Comparison Insights")
@@ -146,9 +174,7 @@ def display_comparison_insights(insights: Dict[str, Any]) -> None:
         st.write("### 🚀 Top Improvements")
         improvements = insights.get('biggest_improvements', [])[:5]
         if improvements:
-            for member, change in improvements:
-                if change > 0:
-                    st.success(f"**{member}**: +{change} ↗️")
+            _display_member_changes([(m, c) for m, c in improvements if c > 0], _IMPROVEMENT_STYLE)
         else:
             st.write("No significant improvements detected.")
     
@@ -156,9 +182,7 @@ def display_comparison_insights(insights: Dict[str, Any]) -> None:
         st.write("### ⚠️ Needs Attention")
         declines = insights.get('biggest_declines', [])[-5:]  # Last 5 (biggest declines)
         if declines:
-            for member, change in declines:
-                if change < 0:
-                    st.error(f"**{member}**: {change} ↘️")
+            _display_member_changes([(m, c) for m, c in declines if c < 0], _DECLINE_STYLE)
         else:
             st.write("No significant declines detected.")
     
@@ -177,50 +201,51 @@ def display_comparison_insights(insights: Dict[str, Any]) -> None:
             st.metric("Decline Rate", f"{summary_stats.get('decline_rate', 0):.1%}")
 
 
-def create_progress_tracker(steps: List[str], current_step: int = 0) -> None:
-    """Create a progress tracker for multi-step processes."""
-    st.write("### Progress")
-    
-    progress_html = "<div style='display: flex; align-items: center; margin: 10px 0;'>"
-    
+# Progress tracker stylesheet; steps reference these classes instead of inline styles
+_PROGRESS_CSS = (
+    "<style>"
+    ".bp-track{display:flex;align-items:center;margin:10px 0;}"
+    ".bp-step{display:flex;align-items:center;margin-right:20px;}"
+    ".bp-circle{border-radius:50%;width:30px;height:30px;display:flex;align-items:center;"
+    "justify-content:center;margin-right:10px;color:white;}"
+    ".bp-done .bp-circle{background-color:#00ff00;}"
+    ".bp-done .bp-label{color:#00ff00;}"
+    ".bp-cur .bp-circle{background-color:#0066cc;}"
+    ".bp-cur .bp-label{color:#0066cc;font-weight:bold;}"
+    ".bp-todo .bp-circle{background-color:#cccccc;color:#666666;}"
+    ".bp-todo .bp-label{color:#666666;}"
+    ".bp-arrow{margin-right:20px;color:#cccccc;}"
+    "</style>"
+)
+
+# Progress tracker HTML templates for completed, current and pending steps
+_COMPLETED_TMPL = "<div class='bp-step bp-done'><div class='bp-circle'>✓</div><span class='bp-label'>{step}</span></div>"
+_CURRENT_TMPL = "<div class='bp-step bp-cur'><div class='bp-circle'>{number}</div><span class='bp-label'>{step}</span></div>"
+_PENDING_TMPL = "<div class='bp-step bp-todo'><div class='bp-circle'>{number}</div><span class='bp-label'>{step}</span></div>"
+_STEP_ARROW = "<span class='bp-arrow'>→</span>"
+
+
+@lru_cache(maxsize=32)
+def _render_progress_html(steps: Tuple[str, ...], current_step: int) -> str:
+    """Build the progress tracker HTML for a given set of steps and position."""
+    parts = []
     for i, step in enumerate(steps):
         if i < current_step:
-            # Completed step
-            progress_html += f"""
-            <div style='display: flex; align-items: center; margin-right: 20px;'>
-                <div style='background-color: #00ff00; color: white; border-radius: 50%; width: 30px; height: 30px; display: flex; align-items: center; justify-content: center; margin-right: 10px;'>
-                    ✓
-                </div>
-                <span style='color: #00ff00;'>{step}</span>
-            </div>
-            """
+            template = _COMPLETED_TMPL
         elif i == current_step:
-            # Current step
-            progress_html += f"""
-            <div style='display: flex; align-items: center; margin-right: 20px;'>
-                <div style='background-color: #0066cc; color: white; border-radius: 50%; width: 30px; height: 30px; display: flex; align-items: center; justify-content: center; margin-right: 10px;'>
-                    {i + 1}
-                </div>
-                <span style='color: #0066cc; font-weight: bold;'>{step}</span>
-            </div>
-            """
+            template = _CURRENT_TMPL
         else:
-            # Pending step
-            progress_html += f"""
-            <div style='display: flex; align-items: center; margin-right: 20px;'>
-                <div style='background-color: #cccccc; color: #666666; border-radius: 50%; width: 30px; height: 30px; display: flex; align-items: center; justify-content: center; margin-right: 10px;'>
-                    {i + 1}
-                </div>
-                <span style='color: #666666;'>{step}</span>
-            </div>
-            """
-        
-        # Add arrow between steps (except for the last step)
-        if i < len(steps) - 1:
-            progress_html += "<span style='margin-right: 20px; color: #cccccc;'>→</span>"
+            template = _PENDING_TMPL
+        parts.append(template.format(step=step, number=i + 1))
     
-    progress_html += "</div>"
-    st.markdown(progress_html, unsafe_allow_html=True)
+    # Arrows go between steps, not after the last one
+    return _PROGRESS_CSS + "<div class='bp-track'>" + _STEP_ARROW.join(parts) + "</div>"
+
+
+def create_progress_tracker(steps: List[str], current_step: int = 0) -> None:
+    """Create a progress tracker for multi-step processes."""
+    st.write("### Progress")
+    st.markdown(_render_progress_html(tuple(steps), current_step), unsafe_allow_html=True)
 
 
 def display_file_validation_results(files: List[Path], errors: List[str]) -> bool:
@@ -235,16 +260,13 @@ def display_file_validation_results(files: List[Path], errors: List[str]) -> boo
         True if validation passed, False otherwise
     """
     if errors:
-        st.error("**File Validation Errors:**")
-        for error in errors:
-            st.error(f"• {error}")
+        display_error_messages(errors, "File Validation Errors")
         return False
     
     if files:
         st.success(f"✅ All {len(files)} files validated successfully!")
         with st.expander("View validated files"):
-            for file_path in files:
-                st.write(f"📄 {file_path.name}")
+            st.markdown("\n".join(f"- 📄 {file_path.name}" for file_path in files))
         return True
     
     st.warning("No files to validate.")
@@ -310,11 +332,14 @@ def create_analysis_overview(report: AnalysisReport) -> None:
     """Create an overview display for analysis report."""
     st.write("### 📈 Analysis Overview")
     
+    # all_members rebuilds and sorts the member set, so read it once
+    all_members = report.all_members
+    
     # Key metrics
     col1, col2, col3, col4, col5 = st.columns(5)
     
     with col1:
-        st.metric("Total Members", len(report.all_members))
+        st.metric("Total Members", len(all_members))
     
     with col2:
         total_referrals = report.metadata.get('total_referrals', 0)
@@ -332,11 +357,15 @@ def create_analysis_overview(report: AnalysisReport) -> None:
     
     with col5:
         # Calculate active members (those with any activity)
-        active_members = len([
-            m for m in report.all_members
-            if (report.referral_matrix.member_statistics.get(m, {}).total_referrals_given > 0 or
-                report.one_to_one_matrix.member_statistics.get(m, {}).total_one_to_ones > 0)
-        ])
+        referral_active = {
+            m for m, s in report.referral_matrix.member_statistics.items()
+            if s.total_referrals_given > 0
+        }
+        oto_active = {
+            m for m, s in report.one_to_one_matrix.member_statistics.items()
+            if s.total_one_to_ones > 0
+        }
+        active_members = len((referral_active | oto_active).intersection(all_members))
         st.metric("Active Members", active_members)
 
 
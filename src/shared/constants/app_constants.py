@@ -1,16 +1,41 @@
 """Application-wide constants."""
 
-from enum import Enum
+from enum import Enum, IntEnum
+from typing import Dict, Final, Tuple, final
 
+__all__ = (
+    "SlipType",
+    "SLIP_TYPE_LOOKUP",
+    "SLIP_REFERRAL",
+    "SLIP_ONE_TO_ONE",
+    "SLIP_TYFCB",
+    "ExcelColumns",
+    "MatrixHeaders",
+    "COMBINATION_SUMMARY_HEADERS",
+    "CombinationValues",
+    "FileNames",
+    "StreamlitConfig",
+    "ValidationMessages",
+)
 
-class SlipType(Enum):
+
+class SlipType(str, Enum):
     """Types of slips in PALMS data."""
     REFERRAL = "Referral"
     ONE_TO_ONE = "One to One"
     TYFCB = "TYFCB"
 
 
-class ExcelColumns(Enum):
+# Direct value -> member lookup for classifying raw slip type strings
+SLIP_TYPE_LOOKUP: Dict[str, SlipType] = {member.value: member for member in SlipType}
+
+# Plain string slip type values for hot loops that only compare raw strings
+SLIP_REFERRAL: Final[str] = SlipType.REFERRAL.value
+SLIP_ONE_TO_ONE: Final[str] = SlipType.ONE_TO_ONE.value
+SLIP_TYFCB: Final[str] = SlipType.TYFCB.value
+
+
+class ExcelColumns(IntEnum):
     """Standard Excel column positions for PALMS data."""
     GIVER_NAME = 0  # Column A
     RECEIVER_NAME = 1  # Column B
@@ -19,6 +44,7 @@ class ExcelColumns(Enum):
     DETAIL = 6  # Column G
 
 
+@final
 class MatrixHeaders:
     """Standard headers for matrix exports."""
     GIVER_RECEIVER = "Giver \\ Receiver"
@@ -39,14 +65,35 @@ class MatrixHeaders:
     CHANGE_IN_NEITHER = "Change in Neither:"
 
 
+# Combination summary headers in the column order they are written
+COMBINATION_SUMMARY_HEADERS: Final[Tuple[str, ...]] = (
+    MatrixHeaders.NEITHER,
+    MatrixHeaders.OTO_ONLY,
+    MatrixHeaders.REFERRAL_ONLY,
+    MatrixHeaders.OTO_AND_REFERRAL,
+)
+
+
+@final
 class CombinationValues:
     """Values used in combination matrix."""
     NEITHER = 0  # No OTO and no referral
     OTO_ONLY = 1  # OTO but no referral
     REFERRAL_ONLY = 2  # Referral but no OTO
     BOTH = 3  # Both OTO and referral
+    
+    @staticmethod
+    def encode(has_oto: bool, has_referral: bool) -> int:
+        """
+        Encode a giver/receiver pair without branching.
+        
+        The OTO flag is bit 0 and the referral flag is bit 1, which yields
+        NEITHER, OTO_ONLY, REFERRAL_ONLY or BOTH directly.
+        """
+        return int(has_oto) | (int(has_referral) << 1)
 
 
+@final
 class FileNames:
     """Standard file names for reports."""
     REFERRAL_MATRIX = "referral_matrix.xlsx"
@@ -57,6 +104,7 @@ class FileNames:
     COMPREHENSIVE_MEMBER_REPORT = "comprehensive_member_report.xlsx"
 
 
+@final
 class StreamlitConfig:
     """Streamlit-specific configuration."""
     PAGE_TITLE = "BNI Palms Analysis"
@@ -68,6 +116,7 @@ class StreamlitConfig:
     ALLOWED_TYPES = ["xls", "xlsx"]
 
 
+@final
 class ValidationMessages:
     """Standard validation and error messages."""
     INVALID_MEMBER_NAME = "Member name cannot be empty"
@@ -77,4 +126,4 @@ class ValidationMessages:
     INVALID_FILE_FORMAT = "Invalid file format. Expected: {}"
     PROCESSING_ERROR = "Error processing file: {}"
     MATRIX_GENERATION_ERROR = "Error generating matrix: {}"
-    EXPORT_ERROR = "Error exporting data: {}"
\ No newline at end of file
+    EXPORT_ERROR = "Error exporting data: {}"
@@ -1,17 +1,55 @@
 """Utilities for exporting analysis results to various formats."""
 
+import heapq
+from operator import attrgetter
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Callable, Optional, Sequence, BinaryIO, Union
 from openpyxl import Workbook
-from openpyxl.styles import PatternFill, Border, Side, Alignment, Font
+from openpyxl.cell import Cell, WriteOnlyCell
+from openpyxl.styles import PatternFill, Border, Side, Alignment, Font, NamedStyle
+from openpyxl.styles.fonts import DEFAULT_FONT
 
-from src.domain.models.analysis_result import AnalysisMatrix, MatrixType
+from src.domain.models.analysis_result import AnalysisMatrix
 from src.domain.models.member import Member
 from src.domain.models.tyfcb import TYFCB
+from src.domain.services.matrix_service import MatrixService
 from src.domain.services.tyfcb_service import TYFCBService, TYFCBSummary
 from src.domain.exceptions.domain_exceptions import ExportError
-from src.infrastructure.data.file_handlers.excel_handler import ExcelHandler
-from src.shared.constants.app_constants import MatrixHeaders, CombinationValues
+from src.infrastructure.data.file_handlers.excel_handler import (
+    ExcelHandler, ColumnWidthTracker, MATRIX_HEADER_STYLE, MATRIX_LABEL_STYLE, MATRIX_VALUE_STYLE,
+    MATRIX_ZERO_STYLE, MATRIX_TOTAL_STYLE, MATRIX_TOTAL_ZERO_STYLE
+)
+from src.shared.constants.app_constants import (
+    MatrixHeaders, CombinationValues, COMBINATION_SUMMARY_HEADERS
+)
+
+# Shared style objects; one instance serves every cell instead of one per cell
+BOLD_FONT = Font(bold=True)
+BOLD_12 = Font(bold=True, size=12)
+BOLD_14 = Font(bold=True, size=14)
+BOLD_16 = Font(bold=True, size=16)
+HEADER_FILL = PatternFill(start_color="CCCCCC", end_color="CCCCCC", fill_type="solid")
+THIN = Side(style="thin")
+THIN_BORDER = Border(left=THIN, right=THIN, top=THIN, bottom=THIN)
+
+# Named styles applied to bordered cells of the summary and TYFCB sheets
+THIN_BORDERED_STYLE = "thin_bordered"
+BOLD_BORDERED_STYLE = "bold_bordered"
+HEADER_STYLE = "report_header"
+CURRENCY_STYLE = "currency"
+BOLD_CURRENCY_STYLE = "bold_currency"
+
+# Dollar amounts are written as numbers and displayed with this format
+DOLLAR_FMT = '"$"#,##0.00'
+
+# Text formatters bound once: currency as displayed (for column widths) and percentages
+_DOLLAR = "${:,.2f}".format
+_PERCENT = "{:.1f}%".format
+
+# Summary column values taken from a member's statistics, per matrix type
+REFERRAL_SUMMARY_FIELDS = attrgetter('total_referrals_given', 'unique_referrals_given')
+OTO_SUMMARY_FIELDS = attrgetter('total_one_to_ones', 'unique_one_to_ones')
+COMBINATION_SUMMARY_FIELDS = attrgetter('neither_count', 'oto_only_count', 'referral_only_count', 'both_count')
 
 
 class ExportService:
@@ -19,6 +57,8 @@ class ExportService:
     
     def __init__(self):
         self.excel_handler = ExcelHandler()
+        self._matrix_service = MatrixService()
+        self._tyfcb_service = TYFCBService()
     
     def export_referral_matrix(self, matrix: AnalysisMatrix, file_path: Path) -> None:
         """
@@ -29,29 +69,28 @@ class ExportService:
             file_path: Output file path
         """
         try:
-            workbook = self.excel_handler.create_styled_workbook()
-            worksheet = workbook.active
-            worksheet.title = "Referral Matrix"
+            workbook = self.excel_handler.create_styled_workbook(write_only=True)
+            self.excel_handler.register_matrix_styles(workbook)
+            worksheet = workbook.create_sheet("Referral Matrix")
             
             members = matrix.get_all_members()
             
-            # Write matrix data
-            self._write_matrix_to_worksheet(worksheet, matrix, members)
-            
-            # Add summary columns for referrals
-            self._add_referral_summary_columns(worksheet, matrix, members)
+            # Build matrix data with summary columns for referrals
+            summary_headers = (
+                MatrixHeaders.TOTAL_REFERRALS_GIVEN,
+                f"{MatrixHeaders.UNIQUE_REFERRALS_GIVEN} (Total Members = {len(members)})"
+            )
+            rows = self._build_matrix_rows(matrix, members, summary_headers, REFERRAL_SUMMARY_FIELDS)
             
             # Add summary rows for referrals
-            self._add_referral_summary_rows(worksheet, matrix, members)
+            self._add_referral_summary_rows(rows, matrix, members)
             
-            # Apply styling
-            data_range = {'max_row': len(members) + 4, 'max_col': len(members) + 4}
-            self.excel_handler.apply_matrix_styling(worksheet, data_range)
-            self.excel_handler.auto_adjust_column_widths(worksheet)
+            # Write styled rows
+            self._write_matrix_to_worksheet(worksheet, rows, len(members))
             
             # Save workbook
             self.excel_handler.save_workbook(workbook, file_path)
-            
+        
         except Exception as e:
             raise ExportError(f"Failed to export referral matrix: {str(e)}")
     
@@ -64,185 +103,269 @@ class ExportService:
             file_path: Output file path
         """
         try:
-            workbook = self.excel_handler.create_styled_workbook()
-            worksheet = workbook.active
-            worksheet.title = "One to One Matrix"
+            workbook = self.excel_handler.create_styled_workbook(write_only=True)
+            self.excel_handler.register_matrix_styles(workbook)
+            worksheet = workbook.create_sheet("One to One Matrix")
             
             members = matrix.get_all_members()
             
-            # Write matrix data
-            self._write_matrix_to_worksheet(worksheet, matrix, members)
-            
-            # Add summary columns for OTO
-            self._add_oto_summary_columns(worksheet, matrix, members)
+            # Build matrix data with summary columns for OTO
+            summary_headers = (
+                MatrixHeaders.TOTAL_OTO,
+                f"{MatrixHeaders.UNIQUE_OTO} (Total Members = {len(members)})"
+            )
+            rows = self._build_matrix_rows(matrix, members, summary_headers, OTO_SUMMARY_FIELDS)
             
-            # Apply styling
-            data_range = {'max_row': len(members) + 2, 'max_col': len(members) + 3}
-            self.excel_handler.apply_matrix_styling(worksheet, data_range)
-            self.excel_handler.auto_adjust_column_widths(worksheet)
+            # Write styled rows
+            self._write_matrix_to_worksheet(worksheet, rows, len(members))
             
             # Save workbook
             self.excel_handler.save_workbook(workbook, file_path)
-            
+        
         except Exception as e:
             raise ExportError(f"Failed to export OTO matrix: {str(e)}")
     
-    def export_combination_matrix(self, matrix: AnalysisMatrix, file_path: Path) -> None:
+    def export_combination_matrix(self, matrix: AnalysisMatrix, file_path: Path,
+                                  include_full_matrix: bool = True) -> None:
         """
         Export combination matrix to Excel file.
         
         Args:
             matrix: Combination analysis matrix
             file_path: Output file path
+            include_full_matrix: Write the member-by-member body; when False only
+                the per-member summary columns are written
         """
         try:
-            workbook = self.excel_handler.create_styled_workbook()
-            worksheet = workbook.active
-            worksheet.title = "Combination Matrix"
+            workbook = self.excel_handler.create_styled_workbook(write_only=True)
+            self.excel_handler.register_matrix_styles(workbook)
+            worksheet = workbook.create_sheet("Combination Matrix")
             
             members = matrix.get_all_members()
             
-            # Write matrix data
-            self._write_matrix_to_worksheet(worksheet, matrix, members)
-            
-            # Add summary columns for combination
-            self._add_combination_summary_columns(worksheet, matrix, members)
+            # Build matrix data with summary columns for combination
+            rows = self._build_matrix_rows(matrix, members, COMBINATION_SUMMARY_HEADERS,
+                                           COMBINATION_SUMMARY_FIELDS,
+                                           include_values=include_full_matrix)
             
-            # Apply styling
-            data_range = {'max_row': len(members) + 2, 'max_col': len(members) + 6}
-            self.excel_handler.apply_matrix_styling(worksheet, data_range)
-            self.excel_handler.auto_adjust_column_widths(worksheet)
+            # Write styled rows
+            body_size = len(members) if include_full_matrix else 0
+            self._write_matrix_to_worksheet(worksheet, rows, body_size)
             
             # Save workbook
             self.excel_handler.save_workbook(workbook, file_path)
-            
+        
         except Exception as e:
             raise ExportError(f"Failed to export combination matrix: {str(e)}")
     
-    def _write_matrix_to_worksheet(self, worksheet, matrix: AnalysisMatrix, 
-                                 members: List[Member]) -> None:
-        """Write the matrix data to a worksheet."""
+    def _build_matrix_rows(self, matrix: AnalysisMatrix, members: List[Member],
+                           summary_headers: Sequence[str],
+                           summary_fn: Callable[[Any], Sequence[Any]],
+                           include_values: bool = True) -> List[List[Any]]:
+        """
+        Build the header row and one row per giver, summary columns included.
+        
+        Each giver's cell values and summary values are assembled in the same
+        pass, with a single statistics lookup per member.
+        
+        Args:
+            matrix: Matrix to export
+            members: Members in row and column order
+            summary_headers: Headers of the trailing summary columns
+            summary_fn: Returns the summary column values from a member's statistics
+            include_values: Include the matrix body; when False rows hold only
+                the giver name and summary columns
+            
+        Returns:
+            List of rows ready to be written
+        """
         try:
-            # Write headers
-            worksheet.cell(row=1, column=1, value=MatrixHeaders.GIVER_RECEIVER).font = Font(bold=True)
-            
-            for col, member in enumerate(members, start=2):
-                worksheet.cell(row=1, column=col, value=member.full_name).font = Font(bold=True)
-            
-            # Write matrix data
-            for row, giver in enumerate(members, start=2):
-                worksheet.cell(row=row, column=1, value=giver.full_name).font = Font(bold=True)
-                
-                for col, receiver in enumerate(members, start=2):
-                    value = matrix.get_cell_value(giver, receiver)
-                    cell = worksheet.cell(row=row, column=col, value=value)
-                    
-                    # Highlight zero values if this is not a combination matrix
-                    if value == 0 and matrix.matrix_type != MatrixType.COMBINATION:
-                        zero_fill = PatternFill(start_color="FFFF00", end_color="FFFF00", fill_type="solid")
-                        cell.fill = zero_fill
-            
+            # Resolve each name once for both the header row and the row labels
+            names = [member.full_name for member in members]
+            rows = [[MatrixHeaders.GIVER_RECEIVER] + (names if include_values else [])]
+            rows[0].extend(summary_headers)
+            
+            if include_values:
+                value_rows = matrix.to_rows(members)
+            else:
+                value_rows = [[] for _ in members]
+            
+            member_statistics = matrix.member_statistics
+            for giver, name, values in zip(members, names, value_rows):
+                row = [name] + values
+                stats = member_statistics.get(giver)
+                if stats is not None:
+                    row.extend(summary_fn(stats))
+                rows.append(row)
+            
+            return rows
+        
         except Exception as e:
-            raise ExportError(f"Error writing matrix to worksheet: {str(e)}")
+            raise ExportError(f"Error building matrix rows: {str(e)}")
     
-    def _add_referral_summary_columns(self, worksheet, matrix: AnalysisMatrix, 
-                                    members: List[Member]) -> None:
-        """Add referral summary columns."""
+    def _write_matrix_to_worksheet(self, worksheet, rows: List[List[Any]], body_size: int,
+                                   highlight_zeros: bool = True) -> None:
+        """
+        Write matrix rows to a write-only worksheet with matrix styling.
+        
+        Cells outside the member body are summary totals and are written bold.
+        
+        Args:
+            worksheet: Write-only worksheet
+            rows: Header row, one row per giver, then any summary rows
+            body_size: Number of members in the matrix body
+            highlight_zeros: Whether zero values get the highlight fill
+        """
         try:
-            # Headers
-            total_given_col = len(members) + 2
-            unique_given_col = len(members) + 3
-            
-            worksheet.cell(row=1, column=total_given_col, 
-                         value=MatrixHeaders.TOTAL_REFERRALS_GIVEN).font = Font(bold=True)
-            worksheet.cell(row=1, column=unique_given_col, 
-                         value=f"{MatrixHeaders.UNIQUE_REFERRALS_GIVEN} (Total Members = {len(members)})").font = Font(bold=True)
-            
-            # Data
-            for row, member in enumerate(members, start=2):
-                stats = matrix.member_statistics.get(member)
-                if stats:
-                    worksheet.cell(row=row, column=total_given_col, 
-                                 value=stats.total_referrals_given).font = Font(bold=True)
-                    worksheet.cell(row=row, column=unique_given_col, 
-                                 value=stats.unique_referrals_given).font = Font(bold=True)
-            
+            width = max(len(row) for row in rows)
+            
+            # Column widths must be set before the first row is streamed, so
+            # measure the plain values first
+            tracker = ColumnWidthTracker()
+            for row in rows:
+                for col_index, value in enumerate(row, start=1):
+                    tracker.observe(col_index, value)
+            tracker.observe(width, None)
+            self.excel_handler.apply_column_widths(worksheet, tracker)
+            
+            # Styled cells are created one row at a time as they are appended
+            for cells in self._iter_styled_matrix_rows(worksheet, rows, width, body_size, highlight_zeros):
+                worksheet.append(cells)
+        
         except Exception as e:
-            raise ExportError(f"Error adding referral summary columns: {str(e)}")
+            raise ExportError(f"Error writing matrix to worksheet: {str(e)}")
     
-    def _add_referral_summary_rows(self, worksheet, matrix: AnalysisMatrix, 
-                                 members: List[Member]) -> None:
-        """Add referral summary rows."""
-        try:
-            total_received_row = len(members) + 2
-            unique_received_row = len(members) + 3
-            
-            worksheet.cell(row=total_received_row, column=1, 
-                         value=MatrixHeaders.TOTAL_REFERRALS_RECEIVED).font = Font(bold=True)
-            worksheet.cell(row=unique_received_row, column=1, 
-                         value=f"{MatrixHeaders.UNIQUE_REFERRALS_RECEIVED} (Total Members = {len(members)})").font = Font(bold=True)
+    def _iter_styled_matrix_rows(self, worksheet, rows: List[List[Any]], width: int,
+                                 body_size: int, highlight_zeros: bool):
+        """
+        Yield each matrix row as a list of styled write-only cells.
+        
+        Args:
+            worksheet: Write-only worksheet the cells belong to
+            rows: Header row, one row per giver, then any summary rows
+            width: Number of columns every row is padded to
+            body_size: Number of members in the matrix body
+            highlight_zeros: Whether zero values get the highlight fill
+        """
+        header_row = rows[0] + [None] * (width - len(rows[0]))
+        yield [self._styled_cell(worksheet, value, MATRIX_HEADER_STYLE) for value in header_row]
+        
+        # Resolve the zero-highlight styles once instead of per cell
+        zero_style = MATRIX_ZERO_STYLE if highlight_zeros else MATRIX_VALUE_STYLE
+        total_zero_style = MATRIX_TOTAL_ZERO_STYLE if highlight_zeros else MATRIX_TOTAL_STYLE
+        
+        for row_index, row in enumerate(rows[1:], start=1):
+            row = row + [None] * (width - len(row))
+            cells = [self._styled_cell(worksheet, row[0], MATRIX_LABEL_STYLE)]
             
-            # Data
-            for col, member in enumerate(members, start=2):
-                stats = matrix.member_statistics.get(member)
-                if stats:
-                    worksheet.cell(row=total_received_row, column=col, 
-                                 value=stats.total_referrals_received).font = Font(bold=True)
-                    worksheet.cell(row=unique_received_row, column=col, 
-                                 value=stats.unique_referrals_received).font = Font(bold=True)
+            # Summary rows are totals throughout; giver rows switch to totals
+            # after the member body
+            body_end = 1 if row_index > body_size else body_size + 1
             
-        except Exception as e:
-            raise ExportError(f"Error adding referral summary rows: {str(e)}")
-    
-    def _add_oto_summary_columns(self, worksheet, matrix: AnalysisMatrix, 
-                               members: List[Member]) -> None:
-        """Add one-to-one summary columns."""
-        try:
-            total_oto_col = len(members) + 2
-            unique_oto_col = len(members) + 3
+            for value in row[1:body_end]:
+                style = zero_style if value == 0 else MATRIX_VALUE_STYLE
+                cells.append(self._styled_cell(worksheet, value, style))
             
-            worksheet.cell(row=1, column=total_oto_col, 
-                         value=MatrixHeaders.TOTAL_OTO).font = Font(bold=True)
-            worksheet.cell(row=1, column=unique_oto_col, 
-                         value=f"{MatrixHeaders.UNIQUE_OTO} (Total Members = {len(members)})").font = Font(bold=True)
+            for value in row[body_end:]:
+                style = total_zero_style if value == 0 else MATRIX_TOTAL_STYLE
+                cells.append(self._styled_cell(worksheet, value, style))
             
-            # Data
-            for row, member in enumerate(members, start=2):
-                stats = matrix.member_statistics.get(member)
-                if stats:
-                    worksheet.cell(row=row, column=total_oto_col, 
-                                 value=stats.total_one_to_ones).font = Font(bold=True)
-                    worksheet.cell(row=row, column=unique_oto_col, 
-                                 value=stats.unique_one_to_ones).font = Font(bold=True)
-                    
-        except Exception as e:
-            raise ExportError(f"Error adding OTO summary columns: {str(e)}")
+            yield cells
+    
+    def _styled_cell(self, worksheet, value: Any, style: str):
+        """Create a write-only cell using a named style."""
+        cell = WriteOnlyCell(worksheet, value=value)
+        cell.style = style
+        return cell
+    
+    def _ensure_export_styles(self, workbook: Workbook) -> None:
+        """
+        Register the bordered report styles on a workbook if they are missing.
+        
+        Bold, header and currency cells each take a single named style, so a
+        cell is styled with one assignment instead of a style plus a font.
+        """
+        styles = {
+            THIN_BORDERED_STYLE: {'font': DEFAULT_FONT},
+            BOLD_BORDERED_STYLE: {'font': BOLD_FONT},
+            HEADER_STYLE: {'font': BOLD_FONT, 'fill': HEADER_FILL},
+            CURRENCY_STYLE: {'font': DEFAULT_FONT, 'number_format': DOLLAR_FMT},
+            BOLD_CURRENCY_STYLE: {'font': BOLD_FONT, 'number_format': DOLLAR_FMT},
+        }
+        existing = workbook.named_styles
+        for name, attributes in styles.items():
+            if name not in existing:
+                workbook.add_named_style(NamedStyle(name=name, border=THIN_BORDER, **attributes))
+    
+    def _bordered_cell(self, worksheet, value: Any, font: Font = None):
+        """Create a thin-bordered write-only cell, optionally with a title font."""
+        cell = WriteOnlyCell(worksheet, value=value)
+        cell.style = THIN_BORDERED_STYLE
+        if font is not None:
+            cell.font = font
+        return cell
+    
+    def _currency_cell(self, worksheet, amount: float, bold: bool = False):
+        """Create a bordered write-only cell holding a dollar amount as a number."""
+        return self._styled_cell(worksheet, amount, BOLD_CURRENCY_STYLE if bold else CURRENCY_STYLE)
     
-    def _add_combination_summary_columns(self, worksheet, matrix: AnalysisMatrix, 
-                                       members: List[Member]) -> None:
-        """Add combination summary columns."""
+    def _append_rows(self, worksheet, rows: List[List[Any]], adjust_widths: bool = False) -> None:
+        """
+        Append rows of values and cells to a write-only worksheet.
+        
+        Plain values are wrapped in bordered cells; empty values stay blank.
+        
+        Args:
+            worksheet: Write-only worksheet
+            rows: Rows of plain values or pre-styled cells
+            adjust_widths: Whether to size the columns from the row contents
+        """
+        # Column widths must be set before the first row is streamed, so they
+        # are measured in a separate pass over the values
+        if adjust_widths:
+            tracker = ColumnWidthTracker()
+            for row in rows:
+                for column, value in enumerate(row, start=1):
+                    if isinstance(value, Cell):
+                        display = value.value
+                        if display is not None and value.number_format == DOLLAR_FMT:
+                            # Size currency columns for the formatted text, not the raw number
+                            display = _DOLLAR(display)
+                    else:
+                        display = value
+                    tracker.observe(column, display)
+            self.excel_handler.apply_column_widths(worksheet, tracker)
+        
+        # Plain values are wrapped row by row as each row is appended
+        for row in rows:
+            worksheet.append([
+                self._bordered_cell(worksheet, value)
+                if value is not None and not isinstance(value, Cell) else value
+                for value in row
+            ])
+    
+    def _add_referral_summary_rows(self, rows: List[List[Any]], matrix: AnalysisMatrix,
+                                 members: List[Member]) -> None:
+        """Add referral summary rows."""
         try:
-            neither_col = len(members) + 2
-            oto_only_col = len(members) + 3
-            referral_only_col = len(members) + 4
-            both_col = len(members) + 5
-            
-            worksheet.cell(row=1, column=neither_col, value=MatrixHeaders.NEITHER).font = Font(bold=True)
-            worksheet.cell(row=1, column=oto_only_col, value=MatrixHeaders.OTO_ONLY).font = Font(bold=True)
-            worksheet.cell(row=1, column=referral_only_col, value=MatrixHeaders.REFERRAL_ONLY).font = Font(bold=True)
-            worksheet.cell(row=1, column=both_col, value=MatrixHeaders.OTO_AND_REFERRAL).font = Font(bold=True)
+            total_received_row = [MatrixHeaders.TOTAL_REFERRALS_RECEIVED]
+            unique_received_row = [f"{MatrixHeaders.UNIQUE_REFERRALS_RECEIVED} (Total Members = {len(members)})"]
             
             # Data
-            for row, member in enumerate(members, start=2):
-                stats = matrix.member_statistics.get(member)
-                if stats:
-                    worksheet.cell(row=row, column=neither_col, value=stats.neither_count).font = Font(bold=True)
-                    worksheet.cell(row=row, column=oto_only_col, value=stats.oto_only_count).font = Font(bold=True)
-                    worksheet.cell(row=row, column=referral_only_col, value=stats.referral_only_count).font = Font(bold=True)
-                    worksheet.cell(row=row, column=both_col, value=stats.both_count).font = Font(bold=True)
-                    
+            stats_list = [matrix.member_statistics.get(member) for member in members]
+            for stats in stats_list:
+                if stats is None:
+                    total_received_row.append(None)
+                    unique_received_row.append(None)
+                    continue
+                total_received_row.append(stats.total_referrals_received)
+                unique_received_row.append(stats.unique_referrals_received)
+            
+            rows.append(total_received_row)
+            rows.append(unique_received_row)
+        
         except Exception as e:
-            raise ExportError(f"Error adding combination summary columns: {str(e)}")
+            raise ExportError(f"Error adding referral summary rows: {str(e)}")
     
     def export_analysis_summary(self, report, file_path: Path) -> None:
         """
@@ -253,11 +376,11 @@ class ExportService:
             file_path: Output file path
         """
         try:
-            workbook = self.excel_handler.create_styled_workbook()
+            workbook = self.excel_handler.create_styled_workbook(write_only=True)
+            self._ensure_export_styles(workbook)
             
             # Create summary sheet
-            summary_sheet = workbook.active
-            summary_sheet.title = "Analysis Summary"
+            summary_sheet = workbook.create_sheet("Analysis Summary")
             
             # Write summary data
             self._write_analysis_summary(summary_sheet, report)
@@ -266,68 +389,44 @@ class ExportService:
             member_sheet = workbook.create_sheet("Member Performance")
             self._write_member_performance(member_sheet, report)
             
-            # Apply styling to both sheets
-            for sheet in workbook.worksheets:
-                # Basic styling
-                for row in sheet.iter_rows():
-                    for cell in row:
-                        if cell.value is not None:
-                            cell.border = Border(left=Side(style="thin"), right=Side(style="thin"),
-                                               top=Side(style="thin"), bottom=Side(style="thin"))
-            
             # Save workbook
             self.excel_handler.save_workbook(workbook, file_path)
-            
+        
         except Exception as e:
             raise ExportError(f"Failed to export analysis summary: {str(e)}")
     
     def _write_analysis_summary(self, worksheet, report) -> None:
         """Write analysis summary to worksheet."""
         try:
-            row = 1
-            
             # Title
-            worksheet.cell(row=row, column=1, value="BNI PALMS Analysis Summary").font = Font(bold=True, size=16)
-            row += 2
+            rows = [
+                [self._bordered_cell(worksheet, "BNI PALMS Analysis Summary", BOLD_16)],
+                []
+            ]
             
             # Metadata
             metadata = report.metadata
-            worksheet.cell(row=row, column=1, value="Chapter Overview").font = Font(bold=True, size=14)
-            row += 1
-            
-            worksheet.cell(row=row, column=1, value="Total Members:")
-            worksheet.cell(row=row, column=2, value=metadata.get('total_members', 0))
-            row += 1
-            
-            worksheet.cell(row=row, column=1, value="Total Referrals:")
-            worksheet.cell(row=row, column=2, value=metadata.get('total_referrals', 0))
-            row += 1
-            
-            worksheet.cell(row=row, column=1, value="Total One-to-Ones:")
-            worksheet.cell(row=row, column=2, value=metadata.get('total_one_to_ones', 0))
-            row += 2
+            rows.append([self._bordered_cell(worksheet, "Chapter Overview", BOLD_14)])
+            rows.append(["Total Members:", metadata.get('total_members', 0)])
+            rows.append(["Total Referrals:", metadata.get('total_referrals', 0)])
+            rows.append(["Total One-to-Ones:", metadata.get('total_one_to_ones', 0)])
+            rows.append([])
             
             # Matrix summaries
-            from src.domain.services.matrix_service import MatrixService
-            matrix_service = MatrixService()
-            
             for matrix_name, matrix in [
                 ("Referral Matrix", report.referral_matrix),
                 ("One-to-One Matrix", report.one_to_one_matrix),
                 ("Combination Matrix", report.combination_matrix)
             ]:
-                worksheet.cell(row=row, column=1, value=matrix_name).font = Font(bold=True, size=12)
-                row += 1
-                
-                summary = matrix_service.get_matrix_summary(matrix)
-                worksheet.cell(row=row, column=1, value="Active Members:")
-                worksheet.cell(row=row, column=2, value=summary['active_members'])
-                row += 1
+                rows.append([self._bordered_cell(worksheet, matrix_name, BOLD_12)])
                 
-                worksheet.cell(row=row, column=1, value="Total Interactions:")
-                worksheet.cell(row=row, column=2, value=summary['total_interactions'])
-                row += 2
+                summary = self._matrix_service.get_matrix_summary(matrix)
+                rows.append(["Active Members:", summary['active_members']])
+                rows.append(["Total Interactions:", summary['total_interactions']])
+                rows.append([])
             
+            self._append_rows(worksheet, rows)
+        
         except Exception as e:
             raise ExportError(f"Error writing analysis summary: {str(e)}")
     
@@ -335,49 +434,60 @@ class ExportService:
         """Write member performance data to worksheet."""
         try:
             # Headers
-            headers = ["Member Name", "Referrals Given", "Referrals Received", 
+            headers = ["Member Name", "Referrals Given", "Referrals Received",
                       "One-to-Ones", "Total Interactions"]
             
-            for col, header in enumerate(headers, start=1):
-                worksheet.cell(row=1, column=col, value=header).font = Font(bold=True)
+            rows = [[self._styled_cell(worksheet, header, BOLD_BORDERED_STYLE) for header in headers]]
             
             # Data
-            row = 2
-            for member in report.all_members:
-                ref_stats = report.referral_matrix.member_statistics.get(member)
-                oto_stats = report.one_to_one_matrix.member_statistics.get(member)
-                combo_stats = report.combination_matrix.member_statistics.get(member)
-                
+            ref_lookup = report.referral_matrix.member_statistics
+            oto_lookup = report.one_to_one_matrix.member_statistics
+            combo_lookup = report.combination_matrix.member_statistics
+            member_stats = [
+                (member, ref_lookup.get(member), oto_lookup.get(member), combo_lookup.get(member))
+                for member in report.all_members
+            ]
+            
+            for member, ref_stats, oto_stats, combo_stats in member_stats:
                 if ref_stats and oto_stats and combo_stats:
-                    worksheet.cell(row=row, column=1, value=member.full_name)
-                    worksheet.cell(row=row, column=2, value=ref_stats.total_referrals_given)
-                    worksheet.cell(row=row, column=3, value=ref_stats.total_referrals_received)
-                    worksheet.cell(row=row, column=4, value=oto_stats.total_one_to_ones)
-                    worksheet.cell(row=row, column=5, value=combo_stats.total_interactions)
-                    row += 1
-                    
+                    rows.append([
+                        member.full_name,
+                        ref_stats.total_referrals_given,
+                        ref_stats.total_referrals_received,
+                        oto_stats.total_one_to_ones,
+                        combo_stats.total_interactions
+                    ])
+            
+            self._append_rows(worksheet, rows)
+        
         except Exception as e:
             raise ExportError(f"Error writing member performance: {str(e)}")
     
-    def export_tyfcb_data(self, members: List[Member], tyfcbs: List[TYFCB], file_path: Path) -> None:
+    def export_tyfcb_data(self, members: List[Member], tyfcbs: List[TYFCB],
+                          file_path: Union[Path, BinaryIO],
+                          tyfcb_summary: Optional[TYFCBSummary] = None,
+                          max_rows: Optional[int] = None) -> None:
         """
         Export TYFCB data to Excel file with detailed breakdown.
         
         Args:
             members: List of all members
             tyfcbs: List of all TYFCB entries
-            file_path: Output file path
+            file_path: Output file path, or a writable binary buffer such as BytesIO
+                when the workbook is served without touching disk
+            tyfcb_summary: Optional precomputed summary of the same TYFCB entries
+            max_rows: Optional limit on the transactions sheet to the largest amounts;
+                the summary sheets always cover every entry
         """
         try:
-            # Initialize TYFCB service
-            tyfcb_service = TYFCBService()
-            tyfcb_summary = tyfcb_service.generate_tyfcb_summary(members, tyfcbs)
+            if tyfcb_summary is None:
+                tyfcb_summary = self._tyfcb_service.generate_tyfcb_summary(members, tyfcbs)
             
-            workbook = self.excel_handler.create_styled_workbook()
+            workbook = self.excel_handler.create_styled_workbook(write_only=True)
+            self._ensure_export_styles(workbook)
             
             # Create summary sheet
-            summary_sheet = workbook.active
-            summary_sheet.title = "TYFCB Summary"
+            summary_sheet = workbook.create_sheet("TYFCB Summary")
             self._write_tyfcb_summary(summary_sheet, tyfcb_summary)
             
             # Create member breakdown sheet
@@ -386,75 +496,45 @@ class ExportService:
             
             # Create detailed transactions sheet
             transactions_sheet = workbook.create_sheet("TYFCB Transactions")
-            self._write_tyfcb_transactions(transactions_sheet, tyfcbs)
-            
-            # Apply styling to all sheets
-            for sheet in workbook.worksheets:
-                for row in sheet.iter_rows():
-                    for cell in row:
-                        if cell.value is not None:
-                            cell.border = Border(left=Side(style="thin"), right=Side(style="thin"),
-                                               top=Side(style="thin"), bottom=Side(style="thin"))
-                self.excel_handler.auto_adjust_column_widths(sheet)
+            self._write_tyfcb_transactions(transactions_sheet, tyfcbs, max_rows)
             
             # Save workbook
             self.excel_handler.save_workbook(workbook, file_path)
-            
+        
         except Exception as e:
             raise ExportError(f"Failed to export TYFCB data: {str(e)}")
     
     def _write_tyfcb_summary(self, worksheet, tyfcb_summary: TYFCBSummary) -> None:
         """Write TYFCB summary to worksheet."""
         try:
-            row = 1
-            
             # Title
-            worksheet.cell(row=row, column=1, value="TYFCB Summary Report").font = Font(bold=True, size=16)
-            row += 2
+            rows = [
+                [self._bordered_cell(worksheet, "TYFCB Summary Report", BOLD_16)],
+                []
+            ]
             
             # Overall statistics
-            worksheet.cell(row=row, column=1, value="Chapter Overview").font = Font(bold=True, size=14)
-            row += 1
-            
-            worksheet.cell(row=row, column=1, value="Total TYFCB Amount:")
-            worksheet.cell(row=row, column=2, value=f"${tyfcb_summary.total_amount:,.2f}")
-            row += 1
-            
-            worksheet.cell(row=row, column=1, value="Total TYFCB Count:")
-            worksheet.cell(row=row, column=2, value=tyfcb_summary.total_count)
-            row += 2
+            rows.append([self._bordered_cell(worksheet, "Chapter Overview", BOLD_14)])
+            rows.append(["Total TYFCB Amount:", self._currency_cell(worksheet, tyfcb_summary.total_amount)])
+            rows.append(["Total TYFCB Count:", tyfcb_summary.total_count])
+            rows.append([])
             
             # Within vs Outside Chapter breakdown
-            worksheet.cell(row=row, column=1, value="Within Chapter Business").font = Font(bold=True, size=12)
-            row += 1
-            
-            worksheet.cell(row=row, column=1, value="Amount:")
-            worksheet.cell(row=row, column=2, value=f"${tyfcb_summary.total_amount_within_chapter:,.2f}")
-            row += 1
-            
-            worksheet.cell(row=row, column=1, value="Count:")
-            worksheet.cell(row=row, column=2, value=tyfcb_summary.total_count_within_chapter)
-            row += 1
-            
-            worksheet.cell(row=row, column=1, value="Percentage:")
-            worksheet.cell(row=row, column=2, value=f"{tyfcb_summary.within_chapter_percentage:.1f}%")
-            row += 2
-            
-            worksheet.cell(row=row, column=1, value="Outside Chapter Business").font = Font(bold=True, size=12)
-            row += 1
+            rows.append([self._bordered_cell(worksheet, "Within Chapter Business", BOLD_12)])
+            rows.append(["Amount:", self._currency_cell(worksheet, tyfcb_summary.total_amount_within_chapter)])
+            rows.append(["Count:", tyfcb_summary.total_count_within_chapter])
+            rows.append(["Percentage:", _PERCENT(tyfcb_summary.within_chapter_percentage)])
+            rows.append([])
             
-            worksheet.cell(row=row, column=1, value="Amount:")
-            worksheet.cell(row=row, column=2, value=f"${tyfcb_summary.total_amount_outside_chapter:,.2f}")
-            row += 1
-            
-            worksheet.cell(row=row, column=1, value="Count:")
-            worksheet.cell(row=row, column=2, value=tyfcb_summary.total_count_outside_chapter)
-            row += 1
+            rows.append([self._bordered_cell(worksheet, "Outside Chapter Business", BOLD_12)])
+            rows.append(["Amount:", self._currency_cell(worksheet, tyfcb_summary.total_amount_outside_chapter)])
+            rows.append(["Count:", tyfcb_summary.total_count_outside_chapter])
             
             outside_percentage = 100 - tyfcb_summary.within_chapter_percentage
-            worksheet.cell(row=row, column=1, value="Percentage:")
-            worksheet.cell(row=row, column=2, value=f"{outside_percentage:.1f}%")
+            rows.append(["Percentage:", _PERCENT(outside_percentage)])
             
+            self._append_rows(worksheet, rows, adjust_widths=True)
+        
         except Exception as e:
             raise ExportError(f"Error writing TYFCB summary: {str(e)}")
     
@@ -463,129 +543,129 @@ class ExportService:
         try:
             # Headers
             headers = [
-                "Member Name", 
+                "Member Name",
                 "Given Within Chapter", "Given Outside Chapter", "Total Given",
                 "Received Within Chapter", "Received Outside Chapter", "Total Received"
             ]
             
-            for col, header in enumerate(headers, start=1):
-                cell = worksheet.cell(row=1, column=col, value=header)
-                cell.font = Font(bold=True)
+            rows = [[self._styled_cell(worksheet, header, BOLD_BORDERED_STYLE) for header in headers]]
             
             # Data
-            row = 2
             for member, stats in tyfcb_summary.member_statistics.items():
                 if stats.total_given > 0 or stats.total_received > 0:  # Only show members with TYFCB activity
-                    worksheet.cell(row=row, column=1, value=member.full_name)
-                    worksheet.cell(row=row, column=2, value=f"${stats.total_given_within_chapter:,.2f}")
-                    worksheet.cell(row=row, column=3, value=f"${stats.total_given_outside_chapter:,.2f}")
-                    worksheet.cell(row=row, column=4, value=f"${stats.total_given:,.2f}").font = Font(bold=True)
-                    worksheet.cell(row=row, column=5, value=f"${stats.total_received_within_chapter:,.2f}")
-                    worksheet.cell(row=row, column=6, value=f"${stats.total_received_outside_chapter:,.2f}")
-                    worksheet.cell(row=row, column=7, value=f"${stats.total_received:,.2f}").font = Font(bold=True)
-                    row += 1
-                    
+                    rows.append([
+                        member.full_name,
+                        self._currency_cell(worksheet, stats.total_given_within_chapter),
+                        self._currency_cell(worksheet, stats.total_given_outside_chapter),
+                        self._currency_cell(worksheet, stats.total_given, bold=True),
+                        self._currency_cell(worksheet, stats.total_received_within_chapter),
+                        self._currency_cell(worksheet, stats.total_received_outside_chapter),
+                        self._currency_cell(worksheet, stats.total_received, bold=True)
+                    ])
+            
+            self._append_rows(worksheet, rows, adjust_widths=True)
+        
         except Exception as e:
             raise ExportError(f"Error writing TYFCB member breakdown: {str(e)}")
     
-    def _write_tyfcb_transactions(self, worksheet, tyfcbs: List[TYFCB]) -> None:
-        """Write detailed TYFCB transactions to worksheet."""
+    def _write_tyfcb_transactions(self, worksheet, tyfcbs: List[TYFCB],
+                                  max_rows: Optional[int] = None) -> None:
+        """Write detailed TYFCB transactions to worksheet, largest amounts first."""
         try:
             # Headers
             headers = ["From", "To", "Amount", "Within Chapter", "Description"]
             
-            for col, header in enumerate(headers, start=1):
-                cell = worksheet.cell(row=1, column=col, value=header)
-                cell.font = Font(bold=True)
+            rows = [[self._styled_cell(worksheet, header, BOLD_BORDERED_STYLE) for header in headers]]
             
-            # Data
-            row = 2
-            for tyfcb in sorted(tyfcbs, key=lambda x: x.amount, reverse=True):  # Sort by amount descending
+            # Data, sorted by amount descending; a row limit only needs a partial sort
+            if max_rows is None:
+                ordered = sorted(tyfcbs, key=attrgetter('amount'), reverse=True)
+            else:
+                ordered = heapq.nlargest(max_rows, tyfcbs, key=attrgetter('amount'))
+            
+            for tyfcb in ordered:
                 giver_name = tyfcb.giver.full_name if tyfcb.giver else "Unknown"
-                worksheet.cell(row=row, column=1, value=giver_name)
-                worksheet.cell(row=row, column=2, value=tyfcb.receiver.full_name)
-                worksheet.cell(row=row, column=3, value=f"${tyfcb.amount:,.2f}")
-                worksheet.cell(row=row, column=4, value="Yes" if tyfcb.within_chapter else "No")
-                worksheet.cell(row=row, column=5, value=tyfcb.description or "")
-                row += 1
-                    
+                rows.append([
+                    giver_name,
+                    tyfcb.receiver.full_name,
+                    self._currency_cell(worksheet, tyfcb.amount),
+                    "Yes" if tyfcb.within_chapter else "No",
+                    tyfcb.description or ""
+                ])
+            
+            self._append_rows(worksheet, rows, adjust_widths=True)
+        
         except Exception as e:
             raise ExportError(f"Error writing TYFCB transactions: {str(e)}")
     
-    def export_comprehensive_member_report(self, report, file_path: Path) -> None:
+    def export_comprehensive_member_report(self, report, file_path: Path,
+                                           tyfcb_summary: Optional[TYFCBSummary] = None) -> None:
         """
         Export comprehensive member report with all key metrics for chapter data only.
         
         Args:
             report: Analysis report containing all data
             file_path: Output file path
+            tyfcb_summary: Optional precomputed summary of the report's TYFCB entries
         """
         try:
-            workbook = self.excel_handler.create_styled_workbook()
-            worksheet = workbook.active
-            worksheet.title = "Comprehensive Member Report"
+            workbook = self.excel_handler.create_styled_workbook(write_only=True)
+            self._ensure_export_styles(workbook)
+            worksheet = workbook.create_sheet("Comprehensive Member Report")
             
             # Write the comprehensive member data
-            self._write_comprehensive_member_data(worksheet, report)
-            
-            # Apply styling
-            for row in worksheet.iter_rows():
-                for cell in row:
-                    if cell.value is not None:
-                        cell.border = Border(left=Side(style="thin"), right=Side(style="thin"),
-                                           top=Side(style="thin"), bottom=Side(style="thin"))
-            
-            # Auto-adjust column widths
-            self.excel_handler.auto_adjust_column_widths(worksheet)
+            self._write_comprehensive_member_data(worksheet, report, tyfcb_summary)
             
             # Save workbook
             self.excel_handler.save_workbook(workbook, file_path)
-            
+        
         except Exception as e:
             raise ExportError(f"Failed to export comprehensive member report: {str(e)}")
     
-    def _write_comprehensive_member_data(self, worksheet, report) -> None:
+    def _write_comprehensive_member_data(self, worksheet, report,
+                                         tyfcb_summary: Optional[TYFCBSummary] = None) -> None:
         """Write comprehensive member data to worksheet."""
         try:
             # Headers
             headers = [
                 "Member Name",
-                "Referrals Received", 
+                "Referrals Received",
                 "Referrals Given",
                 "One to Ones Done",
                 "Number of TYFCBs (Within Chapter)",
                 "Total Value of TYFCBs (Within Chapter)"
             ]
             
-            for col, header in enumerate(headers, start=1):
-                cell = worksheet.cell(row=1, column=col, value=header)
-                cell.font = Font(bold=True)
-                cell.fill = PatternFill(start_color="CCCCCC", end_color="CCCCCC", fill_type="solid")
+            rows = [[self._styled_cell(worksheet, header, HEADER_STYLE) for header in headers]]
             
-            # Initialize TYFCB service for calculations
-            from src.domain.services.tyfcb_service import TYFCBService
-            tyfcb_service = TYFCBService()
+            # The summary keeps within-chapter counts and totals separately, so
+            # only those fields are read below
+            if tyfcb_summary is None:
+                tyfcb_summary = self._tyfcb_service.generate_tyfcb_summary(report.all_members, report.tyfcbs)
             
-            # Filter TYFCBs to only within chapter
-            within_chapter_tyfcbs = [tyfcb for tyfcb in report.tyfcbs if tyfcb.within_chapter]
+            ref_lookup = report.referral_matrix.member_statistics
+            oto_lookup = report.one_to_one_matrix.member_statistics
+            tyfcb_lookup = tyfcb_summary.member_statistics
             
-            # Generate TYFCB summary for within-chapter data only
-            tyfcb_summary = tyfcb_service.generate_tyfcb_summary(report.all_members, within_chapter_tyfcbs)
+            # Totals are accumulated while writing the data rows
+            total_referrals_received = 0
+            total_referrals_given = 0
+            total_one_to_ones = 0
             
             # Data rows
-            row = 2
-            for member in sorted(report.all_members, key=lambda m: m.full_name):
+            for member in sorted(report.all_members, key=attrgetter('full_name')):
+                ref_stats = ref_lookup.get(member)
+                oto_stats = oto_lookup.get(member)
+                tyfcb_member_stats = tyfcb_lookup.get(member)
+                
                 # Get referral statistics
-                ref_stats = report.referral_matrix.member_statistics.get(member)
                 referrals_received = ref_stats.total_referrals_received if ref_stats else 0
                 referrals_given = ref_stats.total_referrals_given if ref_stats else 0
                 
                 # Get one-to-one statistics
-                oto_stats = report.one_to_one_matrix.member_statistics.get(member)
                 one_to_ones_done = oto_stats.total_one_to_ones if oto_stats else 0
                 
                 # Get TYFCB statistics (within chapter only)
-                tyfcb_member_stats = tyfcb_summary.member_statistics.get(member)
                 if tyfcb_member_stats:
                     num_tyfcbs = tyfcb_member_stats.count_received_within_chapter
                     total_tyfcb_value = tyfcb_member_stats.total_received_within_chapter
@@ -593,39 +673,39 @@ class ExportService:
                     num_tyfcbs = 0
                     total_tyfcb_value = 0.0
                 
-                # Write data
-                worksheet.cell(row=row, column=1, value=member.full_name)
-                worksheet.cell(row=row, column=2, value=referrals_received)
-                worksheet.cell(row=row, column=3, value=referrals_given)
-                worksheet.cell(row=row, column=4, value=one_to_ones_done)
-                worksheet.cell(row=row, column=5, value=num_tyfcbs)
-                worksheet.cell(row=row, column=6, value=f"${total_tyfcb_value:,.2f}")
+                total_referrals_received += referrals_received
+                total_referrals_given += referrals_given
+                total_one_to_ones += one_to_ones_done
                 
-                row += 1
+                # Write data
+                rows.append([
+                    member.full_name,
+                    referrals_received,
+                    referrals_given,
+                    one_to_ones_done,
+                    num_tyfcbs,
+                    self._currency_cell(worksheet, total_tyfcb_value)
+                ])
             
             # Add summary row
-            row += 1
-            worksheet.cell(row=row, column=1, value="TOTALS").font = Font(bold=True)
-            
-            # Calculate totals
-            total_referrals_received = sum(
-                report.referral_matrix.member_statistics.get(member, type('obj', (object,), {'total_referrals_received': 0})).total_referrals_received 
-                for member in report.all_members
-            )
-            total_referrals_given = sum(
-                report.referral_matrix.member_statistics.get(member, type('obj', (object,), {'total_referrals_given': 0})).total_referrals_given 
-                for member in report.all_members
-            )
-            total_one_to_ones = sum(
-                report.one_to_one_matrix.member_statistics.get(member, type('obj', (object,), {'total_one_to_ones': 0})).total_one_to_ones 
-                for member in report.all_members
-            ) // 2  # Divide by 2 since each one-to-one is counted twice
-            
-            worksheet.cell(row=row, column=2, value=total_referrals_received).font = Font(bold=True)
-            worksheet.cell(row=row, column=3, value=total_referrals_given).font = Font(bold=True)
-            worksheet.cell(row=row, column=4, value=total_one_to_ones).font = Font(bold=True)
-            worksheet.cell(row=row, column=5, value=tyfcb_summary.total_count_within_chapter).font = Font(bold=True)
-            worksheet.cell(row=row, column=6, value=f"${tyfcb_summary.total_amount_within_chapter:,.2f}").font = Font(bold=True)
+            rows.append([])
+            
+            total_one_to_ones //= 2  # Divide by 2 since each one-to-one is counted twice
+            
+            totals_row = [
+                self._styled_cell(worksheet, value, BOLD_BORDERED_STYLE)
+                for value in (
+                    "TOTALS",
+                    total_referrals_received,
+                    total_referrals_given,
+                    total_one_to_ones,
+                    tyfcb_summary.total_count_within_chapter
+                )
+            ]
+            totals_row.append(self._currency_cell(worksheet, tyfcb_summary.total_amount_within_chapter, bold=True))
+            rows.append(totals_row)
             
+            self._append_rows(worksheet, rows, adjust_widths=True)
+        
         except Exception as e:
             raise ExportError(f"Error writing comprehensive member data: {str(e)}")
\ No newline at end of file
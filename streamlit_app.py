@@ -6,16 +6,7 @@ Modern web interface for BNI chapter analysis using the new clean architecture.
 """
 
 import streamlit as st
-import sys
-from pathlib import Path
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent / "src"))
-
-# Import the new page modules
-from src.presentation.streamlit.pages.introduction_page import render_introduction_page
-from src.presentation.streamlit.pages.reports_page import render_reports_page
-from src.presentation.streamlit.pages.comparison_page import render_comparison_page
 from src.infrastructure.config.settings import get_settings
 
 # Configure Streamlit page
@@ -26,43 +17,84 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Page definitions using new architecture
-intro_page = st.Page(
-    render_introduction_page,
-    title="Introduction",
-    icon=":material/waving_hand:",
-    default=True,
-)
 
-report_page = st.Page(
-    render_reports_page,
-    title="PALMS Analysis", 
-    icon=":material/partner_exchange:",
-)
+# Page modules are imported on first visit, so starting the app on one page
+# does not load the others (and the pandas/openpyxl stack behind them)
+def _introduction_page():
+    """Render the introduction page."""
+    from src.presentation.streamlit.pages.introduction_page import render_introduction_page
+    render_introduction_page()
 
-comparison_page = st.Page(
-    render_comparison_page,
-    title="Matrix Comparison",
-    icon=":material/compare:",
-)
 
-# Navigation setup
-pg = st.navigation(
-    {
+def _reports_page():
+    """Render the PALMS analysis page."""
+    from src.presentation.streamlit.pages.reports_page import render_reports_page
+    render_reports_page()
+
+
+def _comparison_page():
+    """Render the matrix comparison page."""
+    from src.presentation.streamlit.pages.comparison_page import render_comparison_page
+    render_comparison_page()
+
+
+def _build_navigation():
+    """
+    Build the page definitions and sidebar footer.
+    
+    Runs on every rerun: st.Page objects carry per-run state set by
+    st.navigation, so they must not be shared between sessions.
+    
+    Returns:
+        Tuple of (navigation sections, footer HTML)
+    """
+    # Page definitions using new architecture
+    intro_page = st.Page(
+        _introduction_page,
+        title="Introduction",
+        icon=":material/waving_hand:",
+        default=True,
+    )
+    
+    report_page = st.Page(
+        _reports_page,
+        title="PALMS Analysis", 
+        icon=":material/partner_exchange:",
+        url_path="render_reports_page",
+    )
+    
+    comparison_page = st.Page(
+        _comparison_page,
+        title="Matrix Comparison",
+        icon=":material/compare:",
+        url_path="render_comparison_page",
+    )
+    
+    sections = {
         "📋 Info": [intro_page],
         "📊 Analysis": [report_page, comparison_page],
     }
-)
-
-# Add footer with version info
-settings = get_settings()
-st.sidebar.markdown("---")
-st.sidebar.markdown(f"""
+    
+    # Footer with version info
+    settings = get_settings()
+    footer_html = f"""
 <div style='text-align: center; color: #666666; font-size: 12px;'>
     {settings.app_name}<br>
     Version {settings.version}
 </div>
-""", unsafe_allow_html=True)
+"""
+    
+    return sections, footer_html
+
+
+sections, footer_html = _build_navigation()
+
+# Navigation setup
+pg = st.navigation(sections)
+
+# Add footer with version info
+st.sidebar.markdown("---")
+st.sidebar.html(footer_html)
 
 # Run the application
 pg.run()
\ No newline at end of file